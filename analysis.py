@@ -0,0 +1,237 @@
+# -------------------------------------------------------------------
+# PRICE PREDICTION & TREND ANALYSIS
+# -------------------------------------------------------------------
+# Prediction, trend analysis and recommendation scoring. No Streamlit
+# here, so the same functions can run in worker processes and scripts.
+
+import numpy as np
+import pandas as pd
+
+from forecast import MAX_HORIZON, PredictionFan
+from timeslice import last_rows
+
+def predict_prices(df, days_ahead=30):
+    """Predict stock prices using Linear Regression"""
+    return PredictionFan(df, max(days_ahead, MAX_HORIZON)).horizon(days_ahead)
+
+def rsi_series(close, window=14):
+    """RSI for every bar (rolling-mean gains/losses)"""
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).fillna(0)
+    loss = (-delta.where(delta < 0, 0)).fillna(0)
+    
+    avg_gain = gain.rolling(window=window, min_periods=1).mean()
+    avg_loss = loss.rolling(window=window, min_periods=1).mean()
+    
+    rs = avg_gain / avg_loss.replace(0, 0.001)  # Avoid division by zero
+    return 100 - (100 / (1 + rs))
+
+def analyze_trend(df, rsi=None):
+    """Analyze current trend direction and strength (rsi: precomputed rsi_series)"""
+    recent_data = last_rows(df, 60)  # Last 60 bars for better trend analysis
+    
+    # Calculate trend using linear regression
+    x = np.arange(len(recent_data))
+    y = recent_data['Close'].values
+    slope = np.polyfit(x, y, 1)[0]
+    
+    # Calculate momentum (30 bars)
+    current_price = df['Close'].iloc[-1]
+    prev_price = df['Close'].iloc[-30]
+    momentum = ((current_price - prev_price) / prev_price) * 100
+    
+    # Calculate RSI (Relative Strength Index) - improved version
+    if rsi is None:
+        rsi = rsi_series(df['Close'])
+    current_rsi = rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50
+    
+    return {
+        'slope': slope,
+        'momentum': momentum,
+        'current_price': current_price,
+        'rsi': current_rsi
+    }
+
+def generate_recommendation(df, predictions, trend=None):
+    """Generate BUY/SELL/HOLD recommendation (trend: precomputed analyze_trend)"""
+    if trend is None:
+        trend = analyze_trend(df)
+    
+    current_price = trend['current_price']
+    predicted_avg = predictions.mean()
+    predicted_final = predictions[-1]
+    momentum = trend['momentum']
+    rsi = trend['rsi']
+    
+    price_change_pct = ((predicted_final - current_price) / current_price) * 100
+    
+    # Scoring system (adjusted for better balance)
+    score = 0
+    reasons = []
+    
+    # Price trend analysis (weighted more heavily)
+    if predicted_final > current_price * 1.05:  # 5%+ increase
+        score += 3
+        reasons.append(f"✅ Strong price increase predicted ({price_change_pct:.2f}%)")
+    elif predicted_final > current_price:
+        score += 2
+        reasons.append(f"✅ Price increase predicted ({price_change_pct:.2f}%)")
+    elif predicted_final < current_price * 0.95:  # 5%+ decrease
+        score -= 3
+        reasons.append(f"❌ Significant price decrease predicted ({price_change_pct:.2f}%)")
+    elif predicted_final < current_price:
+        score -= 2
+        reasons.append(f"❌ Price decrease predicted ({price_change_pct:.2f}%)")
+    else:
+        reasons.append(f"⚖️ Price predicted to remain stable ({price_change_pct:.2f}%)")
+    
+    # Momentum analysis
+    if momentum > 10:
+        score += 2
+        reasons.append(f"✅ Strong positive momentum ({momentum:.2f}%)")
+    elif momentum > 2:
+        score += 1
+        reasons.append(f"✅ Positive momentum ({momentum:.2f}%)")
+    elif momentum < -10:
+        score -= 2
+        reasons.append(f"❌ Strong negative momentum ({momentum:.2f}%)")
+    elif momentum < -2:
+        score -= 1
+        reasons.append(f"❌ Negative momentum ({momentum:.2f}%)")
+    else:
+        reasons.append(f"⚖️ Neutral momentum ({momentum:.2f}%)")
+    
+    # RSI analysis
+    if rsi < 30:
+        score += 2
+        reasons.append("✅ RSI oversold - strong buying opportunity")
+    elif rsi < 45:
+        score += 1
+        reasons.append("✅ RSI in buying territory")
+    elif rsi > 70:
+        score -= 2
+        reasons.append("❌ RSI overbought - potential sell signal")
+    elif rsi > 55:
+        score -= 1
+        reasons.append("❌ RSI in selling territory")
+    else:
+        reasons.append(f"⚖️ RSI neutral ({rsi:.2f})")
+    
+    # Trend direction (longer term)
+    if trend['slope'] > 0.1:  # Strong uptrend
+        score += 2
+        reasons.append("✅ Strong uptrend detected")
+    elif trend['slope'] > 0:
+        score += 1
+        reasons.append("✅ Uptrend detected")
+    elif trend['slope'] < -0.1:  # Strong downtrend
+        score -= 2
+        reasons.append("❌ Strong downtrend detected")
+    elif trend['slope'] < 0:
+        score -= 1
+        reasons.append("❌ Downtrend detected")
+    else:
+        reasons.append("⚖️ Sideways trend")
+    
+    # Generate recommendation with adjusted thresholds
+    if score >= 4:
+        recommendation = "🟢 STRONG BUY"
+        color = "#00ff00"  # Bright green
+        confidence = min(95, 60 + (score * 5))
+    elif score >= 2:
+        recommendation = "🟢 BUY"
+        color = "#90EE90"  # Light green
+        confidence = min(85, 50 + (score * 5))
+    elif score <= -4:
+        recommendation = "🔴 STRONG SELL"
+        color = "#ff0000"  # Bright red
+        confidence = min(95, 60 + (abs(score) * 5))
+    elif score <= -2:
+        recommendation = "🔴 SELL"
+        color = "#FFB6C1"  # Light red
+        confidence = min(85, 50 + (abs(score) * 5))
+    else:
+        recommendation = "🟡 HOLD"
+        color = "#FFA500"  # Orange
+        confidence = max(30, 50 + (score * 5))
+    
+    return {
+        'recommendation': recommendation,
+        'color': color,
+        'score': score,
+        'confidence': confidence,
+        'reasons': reasons,
+        'price_change_pct': price_change_pct
+    }
+
+# -------------------------------------------------------------------
+# HISTORICAL SCORE TIMELINE
+# -------------------------------------------------------------------
+RECOMMENDATIONS = ["🟢 STRONG BUY", "🟢 BUY", "🔴 STRONG SELL", "🔴 SELL", "🟡 HOLD"]
+
+def score_history(df, days_ahead=30, rsi=None):
+    """generate_recommendation's score evaluated as of every date at once
+
+    Each row uses only the bars up to that date: the 60-bar slope comes
+    from rolling covariance, the regression forecast from expanding sums
+    of x, y and xy, and the momentum/RSI rules from shifted/rolling
+    series. Rows with fewer than 30 bars of history are dropped, like
+    analyze_trend would fail on them.
+    """
+    close = df['Close'].astype(float).reset_index(drop=True)
+    n = np.arange(1, len(close) + 1, dtype=float)
+    x = pd.Series(n - 1)
+
+    # Trend slope over the trailing 60 bars (polyfit == cov/var)
+    slope = (close.rolling(60, min_periods=2).cov(x) / x.rolling(60, min_periods=2).var()).to_numpy()
+
+    # Momentum against the close 29 bars back (iloc[-30])
+    prev = close.shift(29).to_numpy()
+    price = close.to_numpy()
+    momentum = (price - prev) / prev * 100
+
+    rsi = (rsi_series(close) if rsi is None else pd.Series(np.asarray(rsi, dtype=float))).fillna(50).to_numpy()
+
+    # Expanding least squares fit of close on bar number
+    sx = n * (n - 1) / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+    sy = np.cumsum(price)
+    sxy = np.cumsum((n - 1) * price)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = (sxy - sx * sy / n) / (sxx - sx * sx / n)
+        beta = np.where(n > 1, beta, 0.0)
+    alpha = (sy - beta * sx) / n
+    predicted_final = alpha + beta * (n - 1 + days_ahead)
+    price_change_pct = (predicted_final - price) / price * 100
+
+    score = (
+        np.select(
+            [predicted_final > price * 1.05, predicted_final > price,
+             predicted_final < price * 0.95, predicted_final < price],
+            [3, 2, -3, -2], 0)
+        + np.select([momentum > 10, momentum > 2, momentum < -10, momentum < -2], [2, 1, -2, -1], 0)
+        + np.select([rsi < 30, rsi < 45, rsi > 70, rsi > 55], [2, 1, -2, -1], 0)
+        + np.select([slope > 0.1, slope > 0, slope < -0.1, slope < 0], [2, 1, -2, -1], 0)
+    )
+
+    bands = [score >= 4, score >= 2, score <= -4, score <= -2]
+    recommendation = np.select(bands, RECOMMENDATIONS[:4], RECOMMENDATIONS[4])
+    confidence = np.select(
+        bands,
+        [np.minimum(95, 60 + score * 5), np.minimum(85, 50 + score * 5),
+         np.minimum(95, 60 + np.abs(score) * 5), np.minimum(85, 50 + np.abs(score) * 5)],
+        np.maximum(30, 50 + score * 5),
+    )
+
+    timeline = pd.DataFrame({
+        'Date': df['Date'].to_numpy(),
+        'Close': price,
+        'Score': score,
+        'Recommendation': recommendation,
+        'Confidence': confidence,
+        'Expected Change %': price_change_pct,
+        'Slope': slope,
+        'Momentum': momentum,
+        'RSI': rsi,
+    })
+    return timeline.iloc[29:].reset_index(drop=True)
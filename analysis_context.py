@@ -0,0 +1,122 @@
+# -------------------------------------------------------------------
+# SHARED ANALYSIS CONTEXT
+# -------------------------------------------------------------------
+# Everything the AI tab derives from a price history (RSI series, trend
+# summary, prediction fan, recommendation, score timeline, walk-forward
+# forecasts, seasonal decompositions of a bar range) is computed at most
+# once per data version. A context is
+# keyed by a fingerprint of the Date/Close columns, so reruns, slider
+# moves and other sessions looking at the same ticker reuse its results,
+# and new bars produce a new fingerprint and therefore a fresh context.
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from analysis import analyze_trend, generate_recommendation, rsi_series, score_history
+from forecast import MAX_HORIZON, PredictionFan
+from seasonality import decompose, detect_periods
+
+
+def data_fingerprint(df):
+    """Digest of the Date and Close columns identifying one data version"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(df["Date"].to_numpy().astype("datetime64[ns]").view(np.int64).tobytes())
+    h.update(df["Close"].to_numpy(dtype=float).tobytes())
+    return h.hexdigest()
+
+
+class AnalysisContext:
+    """Lazily computed, memoized analysis results for one price history"""
+
+    def __init__(self, df, fingerprint=None):
+        # Only the columns the analysis reads; sessions add their own columns to df
+        self.df = df[["Date", "Close"]]
+        self.fingerprint = fingerprint or data_fingerprint(df)
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key, build):
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+        value = build()
+        with self._lock:
+            return self._memo.setdefault(key, value)
+
+    @property
+    def rsi(self):
+        return self._get("rsi", lambda: rsi_series(self.df["Close"]))
+
+    @property
+    def trend(self):
+        return self._get("trend", lambda: analyze_trend(self.df, rsi=self.rsi))
+
+    def fan(self, max_horizon=MAX_HORIZON):
+        return self._get(("fan", max_horizon), lambda: PredictionFan(self.df, max_horizon))
+
+    def predictions(self, days_ahead):
+        """(future_dates, predictions) sliced from the fitted fan"""
+        return self.fan(max(days_ahead, MAX_HORIZON)).horizon(days_ahead)
+
+    def recommendation(self, days_ahead):
+        return self._get(
+            ("recommendation", days_ahead),
+            lambda: generate_recommendation(self.df, self.predictions(days_ahead)[1], trend=self.trend),
+        )
+
+    def score_history(self, days_ahead=30):
+        return self._get(
+            ("score_history", days_ahead),
+            lambda: score_history(self.df, days_ahead, rsi=self.rsi),
+        )
+
+    def walk_forward(self, horizons, window=None):
+        from walkforward import walk_forward
+
+        horizons = tuple(horizons)
+        return self._get(
+            ("walk_forward", horizons, window),
+            lambda: walk_forward(self.df, horizons, window),
+        )
+
+    def seasonal_periods(self, lo, hi):
+        """[(period, strength)] detected in bars lo:hi"""
+        return self._get(("seasonal_periods", lo, hi), lambda: detect_periods(self.df["Close"].iloc[lo:hi]))
+
+    def decomposition(self, lo, hi, periods):
+        """Trend/seasonal/residual frame of bars lo:hi for the given periods"""
+        periods = tuple(sorted(periods))
+        window = self.df.iloc[lo:hi]
+        return self._get(
+            ("decomposition", lo, hi, periods),
+            lambda: decompose(window["Date"].to_numpy(), window["Close"].to_numpy(), periods),
+        )
+
+
+class ContextCache:
+    """Small LRU of analysis contexts keyed by (ticker, data fingerprint)"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ticker, df):
+        fingerprint = data_fingerprint(df)
+        key = (ticker, fingerprint)
+        with self._lock:
+            ctx = self._contexts.get(key)
+            if ctx is not None:
+                self._contexts.move_to_end(key)
+                return ctx
+
+        ctx = AnalysisContext(df, fingerprint)
+        with self._lock:
+            ctx = self._contexts.setdefault(key, ctx)
+            self._contexts.move_to_end(key)
+            while len(self._contexts) > self.max_entries:
+                self._contexts.popitem(last=False)
+        return ctx
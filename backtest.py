@@ -0,0 +1,181 @@
+# -------------------------------------------------------------------
+# VECTORIZED BACKTESTER
+# -------------------------------------------------------------------
+# Turns a signal series into positions and scores the result with whole
+# array operations over dates. A signal seen at a close is traded at that
+# close and earns the next bar's return, so nothing looks ahead. HOLD and
+# "no crossover" bars keep the previous position (forward fill). Costs
+# are charged in basis points on every unit of position change.
+#
+# Strategies:
+#   ai   BUY/STRONG BUY and SELL/STRONG SELL from score_history
+#   sma  close crossing above/below SMA20 (tab 2 markers)
+#   ema  close crossing above/below EMA20
+#
+# Tickers are backtested on the screener's process pool (screener.fan_out):
+#
+#   python backtest.py AAPL MSFT --strategy sma --cost-bps 5 --short
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from analysis import score_history
+from history_store import HistoryStore
+from screener import fan_out, make_pool
+from signals import cross_above, cross_below
+
+STRATEGIES = ("ai", "sma", "ema")
+TRADING_DAYS = 252
+BACKTEST_COLUMNS = [
+    "Ticker", "Strategy", "Total Return %", "Buy & Hold %", "CAGR %", "Sharpe",
+    "Max Drawdown %", "Hit Rate %", "Trades", "Turnover", "Exposure %",
+]
+
+
+def signal_positions(df, strategy="ai", allow_short=False, days_ahead=30):
+    """Target position (-1, 0, 1) held from each close to the next"""
+    exit_level = -1.0 if allow_short else 0.0
+    n = len(df)
+    target = np.full(n, np.nan)
+
+    if strategy == "ai":
+        timeline = score_history(df, days_ahead)
+        score = timeline["Score"].to_numpy()
+        rows = np.arange(n - len(timeline), n)
+        target[rows[score >= 2]] = 1.0
+        target[rows[score <= -2]] = exit_level
+    elif strategy in ("sma", "ema"):
+        close = df["Close"]
+        line = close.rolling(20).mean() if strategy == "sma" else close.ewm(span=20, adjust=False).mean()
+        target[cross_above(close, line)] = 1.0
+        target[cross_below(close, line)] = exit_level
+    else:
+        raise ValueError(f"unknown strategy {strategy!r}")
+
+    # HOLD / no event: carry the last decision, flat before the first one
+    return pd.Series(target).ffill().fillna(0.0).to_numpy()
+
+
+def backtest_frame(df, positions, cost_bps=5.0):
+    """Per-bar returns, equity curve and drawdown for a position series"""
+    close = df["Close"].to_numpy(dtype=float)
+    positions = np.asarray(positions, dtype=float)
+
+    returns = np.zeros(len(close))
+    returns[1:] = close[1:] / close[:-1] - 1
+    held = np.zeros(len(close))
+    held[1:] = positions[:-1]
+    trades = np.abs(np.diff(positions, prepend=0.0))
+
+    net = held * returns - trades * cost_bps / 10_000
+    equity = np.cumprod(1 + net)
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+
+    return pd.DataFrame({
+        "Date": df["Date"].to_numpy(),
+        "Close": close,
+        "Position": positions,
+        "Held": held,
+        "Return": returns,
+        "Strategy Return": net,
+        "Equity": equity,
+        "Buy & Hold": close / close[0],
+        "Drawdown": drawdown,
+        "Traded": trades,
+    })
+
+
+def trade_returns(result):
+    """Compounded return of each round trip (run of a constant non-zero holding)"""
+    held = result["Held"].to_numpy()
+    net = result["Strategy Return"].to_numpy()
+    run = np.cumsum(np.diff(held, prepend=0.0) != 0)
+    in_market = held != 0
+    if not in_market.any():
+        return np.array([])
+    # Sum log growth per run; only runs that hold something are trades
+    growth = np.bincount(run[in_market], weights=np.log1p(net[in_market]))
+    return np.expm1(growth[np.unique(run[in_market])])
+
+
+def summarize(result, periods_per_year=TRADING_DAYS):
+    """Headline metrics for a backtest_frame result (periods_per_year: bars per year)"""
+    years = max(len(result) - 1, 1) / periods_per_year
+    net = result["Strategy Return"].to_numpy()
+    final = float(result["Equity"].iloc[-1])
+    trips = trade_returns(result)
+    std = net.std()
+    return {
+        "Total Return %": (final - 1) * 100,
+        "Buy & Hold %": (float(result["Buy & Hold"].iloc[-1]) - 1) * 100,
+        "CAGR %": (final ** (1 / years) - 1) * 100 if final > 0 else -100.0,
+        "Sharpe": float(net.mean() / std * np.sqrt(periods_per_year)) if std > 0 else 0.0,
+        "Max Drawdown %": float(result["Drawdown"].min()) * 100,
+        "Hit Rate %": float((trips > 0).mean()) * 100 if len(trips) else np.nan,
+        "Trades": len(trips),
+        "Turnover": float(result["Traded"].sum()) / years,
+        "Exposure %": float((result["Held"] != 0).mean()) * 100,
+    }
+
+
+def backtest(df, strategy="ai", cost_bps=5.0, allow_short=False, days_ahead=30, periods_per_year=TRADING_DAYS):
+    """Backtest one price history: (per-bar frame, metrics dict)"""
+    positions = signal_positions(df, strategy, allow_short, days_ahead)
+    result = backtest_frame(df, positions, cost_bps)
+    return result, summarize(result, periods_per_year)
+
+
+def backtest_chunk(tickers, start, end, strategies, cost_bps=5.0, allow_short=False):
+    """Worker entry point: load a chunk of tickers and backtest each strategy"""
+    frames = HistoryStore().sync_many(tickers, start, end)
+    rows = []
+    for ticker in tickers:
+        df = frames.get(ticker)
+        for strategy in strategies:
+            try:
+                if df is None or len(df) < 60:
+                    raise ValueError("not enough history")
+                _, metrics = backtest(df, strategy, cost_bps, allow_short)
+                rows.append({"Ticker": ticker, "Strategy": strategy, **metrics})
+            except Exception as e:
+                rows.append({"Ticker": ticker, "Strategy": f"⚠️ {e}"})
+    return rows
+
+
+def run_backtests(tickers, start, end, strategies=STRATEGIES, cost_bps=5.0,
+                  allow_short=False, pool=None, chunk_size=None):
+    """Yield lists of metric rows as each chunk of tickers completes"""
+    yield from fan_out(backtest_chunk, tickers, start, end, tuple(strategies), cost_bps, allow_short,
+                       pool=pool, chunk_size=chunk_size)
+
+
+def main():
+    from datetime import date
+
+    from screener import load_universe
+
+    parser = argparse.ArgumentParser(description="Backtest the app's signals across a universe")
+    parser.add_argument("tickers", nargs="*", help="defaults to SCREENER_UNIVERSE or the app universe")
+    parser.add_argument("--universe", help="file with one ticker per line")
+    parser.add_argument("--start", default="2010-01-01")
+    parser.add_argument("--strategy", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--cost-bps", type=float, default=5.0)
+    parser.add_argument("--short", action="store_true", help="go short on sell signals instead of flat")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    tickers = [t.upper() for t in args.tickers] or load_universe(args.universe)
+    end = date.today().strftime("%Y-%m-%d")
+    rows = []
+    with make_pool(args.workers) as pool:
+        for chunk in run_backtests(tickers, args.start, end, args.strategy, args.cost_bps,
+                                   args.short, pool=pool):
+            rows.extend(chunk)
+    table = pd.DataFrame(rows, columns=BACKTEST_COLUMNS).sort_values(["Strategy", "Ticker"])
+    print(table.round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------
+# STARTUP BENCHMARK
+# -------------------------------------------------------------------
+# Cold-start cost of each page, measured in a fresh interpreter per run:
+#
+#   import_ms       importing Streamlit and its test runner
+#   first_paint_ms  executing main.py once for the page (its imports included)
+#   heavy           analysis modules the page itself caused to be loaded
+#
+# The login and signup pages must not load the analysis stack; the
+# benchmark exits non-zero when they do or when a page is slower than
+# --max-ms.
+#
+#   python bench_startup.py
+#   python bench_startup.py --runs 5 --pages login signup trend --max-ms 1500
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("pandas", "numpy", "plotly", "sklearn", "yfinance", "pyarrow")
+LIGHT_PAGES = ("login", "signup")
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+
+heavy = sys.argv[3].split(",")
+preloaded = {m for m in heavy if m in sys.modules}  # e.g. Streamlit imports plotly itself
+
+page = sys.argv[2]
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.session_state["page"] = page
+at.session_state["logged_in"] = page == "trend"
+at.run()
+t2 = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "first_paint_ms": (t2 - t1) * 1000,
+    "heavy": [m for m in heavy if m in sys.modules and m not in preloaded],
+    "errors": len(at.exception),
+}))
+"""
+
+
+def measure(page, env):
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, os.path.join(HERE, "main.py"), page, ",".join(HEAVY_MODULES)],
+        cwd=HERE, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the app pages")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--pages", nargs="+", default=list(LIGHT_PAGES))
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail when a page's median first paint exceeds this")
+    args = parser.parse_args()
+
+    # The trend page must not depend on the network when benchmarked
+    env = dict(os.environ)
+    env.setdefault("MARKET_DATA_PROVIDER", "synthetic")
+
+    failed = False
+    print(f"{'page':<8} {'import_ms':>10} {'first_paint_ms':>15}  heavy modules")
+    for page in args.pages:
+        runs = [measure(page, env) for _ in range(args.runs)]
+        import_ms = statistics.median(r["import_ms"] for r in runs)
+        paint_ms = statistics.median(r["first_paint_ms"] for r in runs)
+        heavy = sorted({m for r in runs for m in r["heavy"]})
+        print(f"{page:<8} {import_ms:>10.0f} {paint_ms:>15.0f}  {', '.join(heavy) or '-'}")
+
+        if any(r["errors"] for r in runs):
+            print(f"  ! {page} raised an exception")
+            failed = True
+        if page in LIGHT_PAGES and heavy:
+            print(f"  ! {page} loaded the analysis stack")
+            failed = True
+        if args.max_ms is not None and paint_ms > args.max_ms:
+            print(f"  ! {page} first paint above {args.max_ms:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
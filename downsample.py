@@ -0,0 +1,81 @@
+# -------------------------------------------------------------------
+# CHART DOWNSAMPLING
+# -------------------------------------------------------------------
+# Line charts are capped at a point budget before they are serialized
+# to Plotly JSON. The budget applies to the visible date range, so
+# narrowing the range (zooming in) re-samples at a higher resolution
+# and a range short enough to fit the budget is sent at full detail.
+
+import os
+
+import numpy as np
+
+POINT_BUDGET = int(os.environ.get("CHART_POINT_BUDGET", "2000"))
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out visually salient points"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x, y = _as_float(x), _as_float(y)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_out):
+    """Min and max of each bucket, so spikes are never dropped"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    y = _as_float(y)
+
+    size = int(np.ceil(n / (n_out // 2)))
+    buckets = int(np.ceil(n / size))
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+
+    offsets = np.arange(buckets) * size
+    lows = offsets + np.nanargmin(padded, axis=1)
+    highs = offsets + np.nanargmax(padded, axis=1)
+    return np.unique(np.concatenate([lows, highs]))
+
+
+def downsample_indices(x, y, n_out=None, method="lttb"):
+    """Row indices to plot for a series within the point budget"""
+    n_out = n_out or POINT_BUDGET
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    return lttb_indices(x, y, n_out)
+
+
+def downsample_frame(df, column="Close", n_out=None, method="lttb"):
+    """Rows of df chosen from one column, for charts whose traces share an x axis"""
+    if len(df) <= (n_out or POINT_BUDGET):
+        return df
+    idx = downsample_indices(df["Date"].values, df[column].values, n_out, method)
+    return df.iloc[idx]
@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------
+# PROCESS-WIDE FIGURE CACHE
+# -------------------------------------------------------------------
+# Charts are cached as serialized Plotly JSON keyed by
+# (ticker, start_date, end_date, last bar timestamp, chart type). The
+# last bar timestamp is the data version: when new bars arrive the old
+# entries simply stop being requested and age out of the LRU. Entries
+# are immutable strings, so every session can share them safely.
+
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+DEFAULT_BUDGET = int(os.environ.get("FIGURE_CACHE_MB", "128")) * 1024 * 1024
+
+
+class FigureCache:
+    """Thread-safe LRU of Plotly figure JSON bounded by total size"""
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> json string
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get_json(self, key):
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return spec
+
+    def put_json(self, key, spec):
+        size = len(spec)
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= len(self._entries.pop(key))
+            if size > self.max_bytes:
+                return
+            self._entries[key] = spec
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._nbytes -= len(old)
+
+    def get_or_build(self, key, build):
+        """Return the figure for key, calling build() only on a miss"""
+        spec = self.get_json(key)
+        if spec is not None:
+            return pio.from_json(spec, skip_invalid=True)
+
+        fig = build()
+        self.put_json(key, pio.to_json(fig, validate=False))
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
@@ -0,0 +1,40 @@
+# -------------------------------------------------------------------
+# MULTI-HORIZON PREDICTION FAN
+# -------------------------------------------------------------------
+# The linear-regression forecast is fitted once per data version and
+# evaluated for every horizon up to MAX_HORIZON in a single predict()
+# call. Moving the Prediction Days slider is then a slice of the cached
+# fan: no frame copy and no refit.
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+MAX_HORIZON = 90  # upper bound of the Prediction Days slider
+
+
+class PredictionFan:
+    """Predicted closes for horizons 1..max_horizon from one regression fit"""
+
+    def __init__(self, df, max_horizon=MAX_HORIZON):
+        closes = df["Close"].to_numpy(dtype=float)
+        n = len(closes)
+
+        model = LinearRegression()
+        model.fit(np.arange(n).reshape(-1, 1), closes)
+
+        self.model = model
+        self.max_horizon = max_horizon
+        self.predictions = model.predict(np.arange(n, n + max_horizon).reshape(-1, 1))
+        # One step per bar: a day for daily history, the typical bar spacing intraday
+        step = pd.Timedelta(days=1)
+        if n > 1:
+            step = min(step, pd.Timedelta(df["Date"].diff().iloc[-50:].median()))
+        self.dates = pd.date_range(start=df["Date"].iloc[-1] + step, periods=max_horizon, freq=step)
+
+    def horizon(self, days_ahead):
+        """(future_dates, predictions) for the next days_ahead days"""
+        if days_ahead > self.max_horizon:
+            raise ValueError(f"Horizon {days_ahead} exceeds fitted maximum {self.max_horizon}")
+        return self.dates[:days_ahead], self.predictions[:days_ahead]
+
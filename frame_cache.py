@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------
+# PROCESS-WIDE PRICE FRAME CACHE
+# -------------------------------------------------------------------
+# Every Streamlit session in the server process shares one cache of
+# loaded price frames keyed by (ticker, start, end, interval). Entries
+# are evicted least-recently-used once the memory budget is exceeded and
+# expire on a market-hours-aware TTL. Callers receive shallow copies that
+# share the cached buffers, so concurrent sessions do not multiply memory.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = (9, 30)
+MARKET_CLOSE = (16, 0)
+OPEN_TTL = 5 * 60  # seconds, while the market is trading
+
+DEFAULT_BUDGET = int(os.environ.get("FRAME_CACHE_MB", "512")) * 1024 * 1024
+
+
+def market_is_open(now):
+    """True during regular US trading hours (holidays are not modelled)"""
+    now = now.astimezone(MARKET_TZ)
+    if now.weekday() >= 5:
+        return False
+    return MARKET_OPEN <= (now.hour, now.minute) < MARKET_CLOSE
+
+
+def next_market_open(now):
+    now = now.astimezone(MARKET_TZ)
+    nxt = now.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1], second=0, microsecond=0)
+    if nxt <= now:
+        nxt += timedelta(days=1)
+    while nxt.weekday() >= 5:
+        nxt += timedelta(days=1)
+    return nxt
+
+
+def expiry_for(now_ts):
+    """Expiry timestamp for an entry stored at now_ts"""
+    now = datetime.fromtimestamp(now_ts, MARKET_TZ)
+    if market_is_open(now):
+        return now_ts + OPEN_TTL
+    # Outside trading hours the bars cannot change until the next session
+    return next_market_open(now).timestamp()
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class FrameCache:
+    """Thread-safe LRU cache of DataFrames with a byte budget and TTL"""
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET, clock=time.time):
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (frame, nbytes, expires)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get(self, key):
+        """Return a shared read-only view of the cached frame, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            frame, nbytes, expires = entry
+            if self.clock() >= expires:
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return frame.copy(deep=False)
+
+    def put(self, key, frame):
+        nbytes = frame_nbytes(frame)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (frame, nbytes, expiry_for(self.clock()))
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def get_or_load(self, key, loader):
+        """Return the cached frame for key, calling loader() once on a miss"""
+        frame = self.get(key)
+        if frame is not None:
+            return frame
+
+        # Sessions asking for the same key wait for a single load
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            frame = self.get(key)
+            if frame is None:
+                frame = loader()
+                if not frame.empty:
+                    self.put(key, frame)
+                frame = frame.copy(deep=False)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return frame
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._nbytes -= nbytes
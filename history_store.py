@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------
+# ON-DISK OHLCV HISTORY STORE
+# -------------------------------------------------------------------
+# One Parquet file per ticker holds the daily bars in the same shape
+# load_data() returns (flattened columns, "Date" column). A small JSON
+# sidecar remembers which range has been synced, so a cold load reads
+# from disk and a warm refresh only downloads the bars after the last
+# stored date. Bars come from the configured provider (see providers.py),
+# and the store directory itself is a valid LocalFileProvider fixture dir.
+# A failed fetch (an error, or no bars for completed sessions) leaves the
+# sync stamp alone, so the next call retries instead of waiting a day.
+
+import json
+import os
+import threading
+from datetime import date
+
+import pandas as pd
+
+from market_calendar import expects_bars
+from providers import OHLCV_COLUMNS, date_window, get_provider
+
+STORE_DIR = os.environ.get("STOCK_STORE_DIR", ".market_data")
+
+
+class HistoryStore:
+    """Per-ticker Parquet history with incremental delta sync"""
+
+    def __init__(self, root=STORE_DIR, provider=None):
+        self.root = root
+        self.provider = provider or get_provider()
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, ticker, ext):
+        return os.path.join(self.root, f"{ticker.upper()}.{ext}")
+
+    def read(self, ticker):
+        """Return the stored history for a ticker, or None"""
+        path = self._path(ticker, "parquet")
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)
+
+    def read_meta(self, ticker):
+        path = self._path(ticker, "json")
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def write(self, ticker, df, start):
+        """Atomically replace the stored history and its sync metadata"""
+        # Unique temp names so the background warmer and a session never collide
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        path = self._path(ticker, "parquet")
+        df.to_parquet(path + suffix, index=False)
+        os.replace(path + suffix, path)
+
+        meta_path = self._path(ticker, "json")
+        with open(meta_path + suffix, "w") as f:
+            json.dump({"start": start, "synced": date.today().isoformat()}, f)
+        os.replace(meta_path + suffix, meta_path)
+
+    def _pending(self, ticker, start, end):
+        """Return (stored, synced_start, fetch_from); fetch_from is None when current"""
+        stored = self.read(ticker)
+        meta = self.read_meta(ticker)
+
+        # Nothing usable on disk (or an earlier start was requested): full fetch
+        if stored is None or stored.empty or meta.get("start", start) > start:
+            return None, start, start
+
+        delta_start = (stored["Date"].max() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        if meta.get("synced") == date.today().isoformat() or delta_start >= end:
+            return stored, meta.get("start", start), None
+        return stored, meta.get("start", start), delta_start
+
+    def _merge(self, ticker, stored, synced_start, delta, start, end):
+        """Append fetched bars to the stored history and return [start, end)"""
+        if stored is None:
+            if delta is not None and not delta.empty:
+                self.write(ticker, delta, synced_start)
+            return delta
+        if delta is None:
+            # The fetch failed: keep the old sync stamp so the next call retries
+            return date_window(stored, start, end)
+
+        if delta.empty:
+            if expects_bars(stored["Date"].max() + pd.Timedelta(days=1), end):
+                # Completed sessions came back without bars: a quiet failure, not "up to date"
+                return date_window(stored, start, end)
+        else:
+            stored = (
+                pd.concat([stored, delta], ignore_index=True)
+                .drop_duplicates(subset="Date", keep="last")
+                .sort_values("Date", ignore_index=True)
+            )
+        self.write(ticker, stored, synced_start)
+
+        return date_window(stored, start, end)
+
+    def sync(self, ticker, start, end):
+        """Return bars in [start, end), fetching only what is missing on disk"""
+        stored, synced_start, fetch_from = self._pending(ticker, start, end)
+        if fetch_from is None:
+            return date_window(stored, start, end)
+
+        if stored is None:
+            try:
+                fetched = self.provider.download(ticker, start, end)
+            except Exception:
+                # Nothing stored and the fetch failed: no bars, retried on the next call
+                return pd.DataFrame(columns=OHLCV_COLUMNS)
+            return self._merge(ticker, None, synced_start, fetched, start, end)
+
+        try:
+            delta = self.provider.download(ticker, fetch_from, end)
+        except Exception:
+            # Provider unavailable or rate limited: serve what we have
+            delta = None
+        return self._merge(ticker, stored, synced_start, delta, start, end)
+
+    def sync_many(self, tickers, start, end):
+        """Sync several tickers with one batched download per missing range"""
+        frames = {}
+        pending = {}
+        for ticker in tickers:
+            stored, synced_start, fetch_from = self._pending(ticker, start, end)
+            if fetch_from is None:
+                frames[ticker] = date_window(stored, start, end)
+            else:
+                # Tickers synced on the same day share a delta start
+                pending.setdefault(fetch_from, []).append((ticker, stored, synced_start))
+
+        for fetch_from, group in pending.items():
+            try:
+                fetched = self.provider.download_many([t for t, _, _ in group], fetch_from, end)
+            except Exception:
+                fetched = None
+            for ticker, stored, synced_start in group:
+                # None: this ticker failed inside the batch; missing: it has no new bars
+                delta = None if fetched is None else fetched.get(ticker, pd.DataFrame())
+                df = self._merge(ticker, stored, synced_start, delta, start, end)
+                if df is not None:
+                    frames[ticker] = df
+        return frames
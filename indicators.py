@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------
+# STREAMING INDICATOR STATE
+# -------------------------------------------------------------------
+# IndicatorState is seeded once from history with vectorized pandas
+# passes and then advanced one bar at a time in constant time: ring
+# buffers with running sums for the SMA/Bollinger window and the RSI
+# averages, and the usual recursive update for the EMA. The state is a
+# plain dict when saved, so it can be persisted next to the bar history.
+
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+import pandas as pd
+
+INDICATOR_COLUMNS = ["SMA20", "EMA20", "STD", "UB", "LB", "RSI"]
+COLUMN_DTYPE = np.float32  # stored columns; computed (and streamed) in float64
+RESUM_EVERY = 1000  # re-add the window from scratch to bound float drift
+
+
+def rsi_from(avg_gain, avg_loss):
+    """RSI from average gain/loss, with the same zero-loss guard as analyze_trend"""
+    rs = avg_gain / (avg_loss if avg_loss != 0 else 0.001)
+    return 100 - (100 / (1 + rs))
+
+
+class IndicatorState:
+    """O(1)-per-bar SMA, EMA, Bollinger and RSI accumulators"""
+
+    def __init__(self, window=20, span=20, rsi_window=14, rsi_mode="sma", num_std=2):
+        self.window = window
+        self.span = span
+        self.rsi_window = rsi_window
+        self.rsi_mode = rsi_mode  # "sma" matches analyze_trend, "wilder" smooths
+        self.num_std = num_std
+        self.alpha = 2 / (span + 1)
+        self.reset()
+
+    def reset(self):
+        self.closes = deque(maxlen=self.window)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.ema = None
+        self.last_close = None
+        self.gains = deque(maxlen=self.rsi_window)
+        self.losses = deque(maxlen=self.rsi_window)
+        self.gain_total = 0.0
+        self.loss_total = 0.0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    # ---------------------------------------------------------------
+    # Seeding
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_history(cls, closes, **kwargs):
+        """Seed from a full close history in one vectorized pass"""
+        state = cls(**kwargs)
+        closes = pd.Series(np.asarray(closes, dtype=float))
+        if closes.empty:
+            return state
+
+        state.closes.extend(closes.tail(state.window).tolist())
+        state.total = float(sum(state.closes))
+        state.total_sq = float(sum(c * c for c in state.closes))
+        state.ema = float(closes.ewm(span=state.span, adjust=False).mean().iloc[-1])
+        state.last_close = float(closes.iloc[-1])
+        state.count = len(closes)
+
+        delta = closes.diff().fillna(0)
+        gains = delta.clip(lower=0)
+        losses = (-delta).clip(lower=0)
+        state.gains.extend(gains.tail(state.rsi_window).tolist())
+        state.losses.extend(losses.tail(state.rsi_window).tolist())
+        state.gain_total = float(sum(state.gains))
+        state.loss_total = float(sum(state.losses))
+        wilder = 1 / state.rsi_window
+        state.avg_gain = float(gains.ewm(alpha=wilder, adjust=False).mean().iloc[-1])
+        state.avg_loss = float(losses.ewm(alpha=wilder, adjust=False).mean().iloc[-1])
+        return state
+
+    # ---------------------------------------------------------------
+    # Streaming update
+    # ---------------------------------------------------------------
+    def update(self, close):
+        """Advance the state by one bar and return the new indicator values"""
+        close = float(close)
+
+        if len(self.closes) == self.window:
+            old = self.closes[0]
+            self.total -= old
+            self.total_sq -= old * old
+        self.closes.append(close)
+        self.total += close
+        self.total_sq += close * close
+
+        self.ema = close if self.ema is None else self.alpha * close + (1 - self.alpha) * self.ema
+
+        delta = 0.0 if self.last_close is None else close - self.last_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        if len(self.gains) == self.rsi_window:
+            self.gain_total -= self.gains[0]
+            self.loss_total -= self.losses[0]
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_total += gain
+        self.loss_total += loss
+        if self.count == 0:
+            self.avg_gain, self.avg_loss = gain, loss
+        else:
+            self.avg_gain += (gain - self.avg_gain) / self.rsi_window
+            self.avg_loss += (loss - self.avg_loss) / self.rsi_window
+
+        self.last_close = close
+        self.count += 1
+        if self.count % RESUM_EVERY == 0:
+            self._resum()
+        return self.values()
+
+    def _resum(self):
+        self.total = float(sum(self.closes))
+        self.total_sq = float(sum(c * c for c in self.closes))
+        self.gain_total = float(sum(self.gains))
+        self.loss_total = float(sum(self.losses))
+
+    def values(self):
+        """Current SMA20, EMA20, STD, UB, LB and RSI (NaN until warmed up)"""
+        n = len(self.closes)
+        if n == self.window:
+            sma = self.total / n
+            var = max((self.total_sq - n * sma * sma) / (n - 1), 0.0)
+            std = var ** 0.5
+        else:
+            sma = std = np.nan
+
+        if self.rsi_mode == "wilder":
+            rsi = rsi_from(self.avg_gain, self.avg_loss)
+        elif self.gains:
+            rsi = rsi_from(self.gain_total / len(self.gains), self.loss_total / len(self.losses))
+        else:
+            rsi = np.nan
+
+        return {
+            "SMA20": sma,
+            "EMA20": np.nan if self.ema is None else self.ema,
+            "STD": std,
+            "UB": sma + self.num_std * std,
+            "LB": sma - self.num_std * std,
+            "RSI": rsi,
+        }
+
+    # ---------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------
+    def to_dict(self):
+        return {
+            "params": {
+                "window": self.window,
+                "span": self.span,
+                "rsi_window": self.rsi_window,
+                "rsi_mode": self.rsi_mode,
+                "num_std": self.num_std,
+            },
+            "closes": list(self.closes),
+            "ema": self.ema,
+            "last_close": self.last_close,
+            "gains": list(self.gains),
+            "losses": list(self.losses),
+            "avg_gain": self.avg_gain,
+            "avg_loss": self.avg_loss,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(**data["params"])
+        state.closes.extend(data["closes"])
+        state.gains.extend(data["gains"])
+        state.losses.extend(data["losses"])
+        state._resum()
+        state.ema = data["ema"]
+        state.last_close = data["last_close"]
+        state.avg_gain = data["avg_gain"]
+        state.avg_loss = data["avg_loss"]
+        state.count = data["count"]
+        return state
+
+
+def indicator_frame(closes, window=20, span=20, num_std=2):
+    """Full-history indicator columns in one vectorized pass"""
+    closes = pd.Series(np.asarray(closes, dtype=float))
+    sma = closes.rolling(window).mean()
+    std = closes.rolling(window).std()
+    return pd.DataFrame({
+        "SMA20": sma,
+        "EMA20": closes.ewm(span=span, adjust=False).mean(),
+        "STD": std,
+        "UB": sma + num_std * std,
+        "LB": sma - num_std * std,
+    })
+
+
+class IndicatorBook:
+    """Per-ticker indicator columns that grow with new bars instead of recomputing"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._books = OrderedDict()  # ticker -> (last Date, columns frame, IndicatorState), LRU order
+        self._lock = threading.Lock()
+
+    def columns(self, ticker, df):
+        """Indicator columns aligned with df's rows"""
+        with self._lock:
+            return self._columns(ticker, df)
+
+    def _columns(self, ticker, df):
+        entry = self._books.get(ticker)
+        if entry is not None:
+            last_date, cols, state = entry
+            n_old = len(cols)
+            # Same history, possibly with new bars appended
+            if n_old <= len(df) and n_old and df["Date"].iloc[n_old - 1] == last_date:
+                if n_old == len(df):
+                    self._books.move_to_end(ticker)
+                    return cols
+                rows = [state.update(c) for c in df["Close"].iloc[n_old:]]
+                new = pd.DataFrame(rows, columns=INDICATOR_COLUMNS).drop(columns="RSI").astype(COLUMN_DTYPE)
+                cols = pd.concat([cols, new], ignore_index=True)
+                self._remember(ticker, (df["Date"].iloc[-1], cols, state))
+                return cols
+
+        cols = indicator_frame(df["Close"]).astype(COLUMN_DTYPE)
+        state = IndicatorState.from_history(df["Close"])
+        if len(df):
+            self._remember(ticker, (df["Date"].iloc[-1], cols, state))
+        return cols
+
+    def _remember(self, ticker, entry):
+        self._books[ticker] = entry
+        self._books.move_to_end(ticker)
+        while len(self._books) > self.max_entries:
+            self._books.popitem(last=False)
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------
+# BACKGROUND JOBS
+# -------------------------------------------------------------------
+# Long analysis calls run on a small thread pool instead of the
+# Streamlit script thread. A Job carries status, progress and the
+# result; the page keeps the Job in session state and polls it, so the
+# script run returns at once and the rest of the page stays responsive.
+# Jobs are keyed (ticker, data version, parameters): a second request
+# for the same key, from any session, attaches to the existing job.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", "2"))
+KEEP_FINISHED = 128  # finished jobs kept for late pollers / re-use
+
+
+class Job:
+    """Status, progress and outcome of one background call"""
+
+    def __init__(self, key):
+        self.key = key
+        self.status = "queued"  # queued -> running -> done | failed
+        self.progress = 0.0
+        self.message = "Queued"
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def report(self, progress, message=None):
+        """Progress callback handed to the job function"""
+        self.progress = min(max(float(progress), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+
+class JobRunner:
+    """Thread pool plus a registry of jobs by key"""
+
+    def __init__(self, max_workers=JOB_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, **kwargs):
+        """Run fn(*args, report=job.report, **kwargs) in the background"""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status != "failed":
+                self._jobs.move_to_end(key)
+                return job
+            job = Job(key)
+            self._jobs[key] = job
+            self._prune()
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = "running"
+        job.message = "Running"
+        try:
+            job.result = fn(*args, report=job.report, **kwargs)
+            job.progress = 1.0
+            job.message = "Done"
+            job.status = "done"
+        except Exception as e:
+            job.error = e
+            job.message = f"Failed: {e}"
+            job.status = "failed"
+        finally:
+            job.finished = time.time()
+
+    def _prune(self):
+        finished = [k for k, j in self._jobs.items() if j.done]
+        for key in finished[:max(0, len(finished) - KEEP_FINISHED)]:
+            del self._jobs[key]
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------
+# LIVE CHART COMPONENT
+# -------------------------------------------------------------------
+# A small canvas chart (close, SMA20 and Bollinger bands) that keeps its
+# points in the browser. Each script run sends it a patch holding only
+# the bars after the cursor the session last sent; the component appends
+# them and redraws, so the full series crosses the wire once per feed.
+# A patch that does not continue the series the browser holds (page
+# reloaded, feed restarted) makes the component ask for a reset.
+
+import streamlit as st
+
+MAX_POINTS = 600  # points the browser keeps per series
+REFRESH_SECONDS = 1.0  # how often the live fragment polls the feed
+
+HTML = """
+<div class="live-chart">
+  <div class="live-label"></div>
+  <canvas height="320"></canvas>
+</div>
+"""
+
+CSS = """
+.live-chart { position: relative; width: 100%; }
+.live-chart canvas { width: 100%; height: 320px; display: block; }
+.live-label { position: absolute; right: 8px; top: 4px; color: #fff; font: 12px sans-serif; opacity: 0.8; }
+"""
+
+JS = """
+const SERIES = ["t", "close", "sma", "ub", "lb"];
+const STYLE = {
+  close: ["#ffffff", []], sma: ["orange", []], ub: ["#888888", [4, 4]], lb: ["#888888", [4, 4]],
+};
+
+function draw(canvas, s) {
+  const width = canvas.clientWidth || 600;
+  canvas.width = width;
+  const ctx = canvas.getContext("2d");
+  const h = canvas.height, pad = 6;
+  ctx.clearRect(0, 0, width, h);
+  const n = s.close.length;
+  if (!n) return;
+  let lo = Infinity, hi = -Infinity;
+  for (const k of ["close", "ub", "lb"]) {
+    for (const v of s[k]) if (v !== null) { lo = Math.min(lo, v); hi = Math.max(hi, v); }
+  }
+  if (hi === lo) { hi += 1; lo -= 1; }
+  const x = (i) => pad + (i * (width - 2 * pad)) / Math.max(n - 1, 1);
+  const y = (v) => h - pad - ((v - lo) * (h - 2 * pad)) / (hi - lo);
+  for (const [k, [color, dash]] of Object.entries(STYLE)) {
+    ctx.strokeStyle = color;
+    ctx.setLineDash(dash);
+    ctx.beginPath();
+    let pen = false;
+    s[k].forEach((v, i) => {
+      if (v === null) { pen = false; return; }
+      pen ? ctx.lineTo(x(i), y(v)) : ctx.moveTo(x(i), y(v));
+      pen = true;
+    });
+    ctx.stroke();
+  }
+}
+
+export default function (component) {
+  const { data, parentElement, setTriggerValue } = component;
+  const canvas = parentElement.querySelector("canvas");
+  let s = parentElement.__live;
+  if (data.reset || !s || s.epoch !== data.epoch) {
+    s = parentElement.__live = { epoch: data.epoch, seq: data.from };
+    for (const k of SERIES) s[k] = [];
+  }
+  if (data.from === s.seq && data.seq > s.seq) {
+    for (const k of SERIES) {
+      s[k].push(...data[k]);
+      if (s[k].length > data.keep) s[k].splice(0, s[k].length - data.keep);
+    }
+    s.seq = data.seq;
+  } else if (data.from !== s.seq && data.seq !== s.seq) {
+    setTriggerValue("resync", true);
+  }
+  const last = s.t.length ? new Date(s.t[s.t.length - 1]).toISOString().slice(0, 16).replace("T", " ") : "";
+  parentElement.querySelector(".live-label").textContent = last;
+  draw(canvas, s);
+}
+"""
+
+_component = st.components.v2.component("live_price_chart", html=HTML, css=CSS, js=JS)
+
+
+def chart_patch(epoch, cursor, seq, bars, reset=False):
+    """Component payload for the bars published after cursor (columnar, JSON)"""
+    patch = {"epoch": epoch, "from": cursor, "seq": seq, "reset": reset, "keep": MAX_POINTS}
+    for field in ("t", "close", "sma", "ub", "lb"):
+        patch[field] = [bar[field] for bar in bars]
+    return patch
+
+
+def live_chart(patch, key):
+    """Mount/update the live chart; True when the browser asked for a full reset"""
+    result = _component(data=patch, key=key, on_resync_change=lambda: None)
+    return bool(result.resync)
@@ -0,0 +1,159 @@
+# -------------------------------------------------------------------
+# LIVE BAR FEED
+# -------------------------------------------------------------------
+# A BarFeed is an append-only log of live bars for one ticker. Each bar
+# gets a sequence number and the streaming indicators (IndicatorState,
+# O(1) per bar) when it is published, so every watching session reads
+# the same precomputed values. Readers keep a cursor and ask only for
+# the bars after it, which is what the live chart sends to the browser.
+#
+# ReplayFeed is the offline stand-in for a market data subscription: it
+# replays stored 1-minute bars into a feed at LIVE_REPLAY_RATE bars per
+# second, looping with shifted timestamps once it runs out. A real feed
+# only needs to call BarFeed.publish() for each bar it receives.
+#
+# LiveHub owns one feed per ticker; a replay thread stops when nobody
+# has read its feed for IDLE_SECONDS and is restarted on the next read.
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from indicators import IndicatorState
+
+LIVE_WINDOW = 390  # bars a new subscriber starts with (one session of 1-minute bars)
+LIVE_BUFFER = 4 * LIVE_WINDOW  # bars kept for readers that fall behind
+REPLAY_RATE = float(os.environ.get("LIVE_REPLAY_RATE", "1.0"))  # replayed bars per second
+IDLE_SECONDS = 300
+
+_epochs = itertools.count(1)
+
+
+def _value(x):
+    return None if np.isnan(x) else round(float(x), 4)
+
+
+class BarFeed:
+    """Sequenced live bars with their indicator values, read by cursor"""
+
+    def __init__(self, ticker, maxlen=LIVE_BUFFER):
+        self.ticker = ticker
+        self.epoch = next(_epochs)  # changes whenever the feed is recreated
+        self.seq = 0
+        self.last_read = time.time()
+        self._bars = deque(maxlen=maxlen)
+        self._state = IndicatorState()
+        self._cond = threading.Condition()
+
+    def publish(self, when, close, volume=0):
+        values = self._state.update(close)
+        bar = {
+            "t": int(np.datetime64(when, "ms").astype(np.int64)),
+            "close": round(float(close), 4),
+            "volume": int(volume),
+            "sma": _value(values["SMA20"]),
+            "ub": _value(values["UB"]),
+            "lb": _value(values["LB"]),
+            "rsi": _value(values["RSI"]),
+        }
+        with self._cond:
+            self._bars.append(bar)
+            self.seq += 1
+            self._cond.notify_all()
+
+    def snapshot(self, n=LIVE_WINDOW):
+        """(seq, the last n bars)"""
+        with self._cond:
+            self.last_read = time.time()
+            return self.seq, list(self._bars)[-n:]
+
+    def since(self, cursor, timeout=0):
+        """(seq, bars after cursor), or None once the cursor has left the buffer"""
+        with self._cond:
+            if timeout and self.seq <= cursor:
+                self._cond.wait(timeout)
+            self.last_read = time.time()
+            first = self.seq - len(self._bars)
+            if cursor < first:
+                return None
+            return self.seq, list(self._bars)[cursor - first:]
+
+
+class ReplayFeed(threading.Thread):
+    """Daemon thread replaying stored bars into a BarFeed as if they were live"""
+
+    def __init__(self, feed, bars, rate=REPLAY_RATE, backlog=LIVE_WINDOW):
+        super().__init__(name=f"replay-{feed.ticker}", daemon=True)
+        self.feed = feed
+        self.dates = bars["Date"].to_numpy().astype("datetime64[ms]")
+        self.closes = bars["Close"].to_numpy(dtype=float)
+        self.volumes = bars["Volume"].to_numpy()
+        self.rate = rate
+        self.backlog = min(backlog, len(bars))
+        self._stopped = threading.Event()
+        # A backlog is published up front so the first chart is not empty
+        for i in range(self.backlog):
+            feed.publish(self.dates[i], self.closes[i], self.volumes[i])
+
+    def run(self):
+        n = len(self.closes)
+        step = np.median(np.diff(self.dates)) if n > 1 else np.timedelta64(60, "s")
+        span = self.dates[-1] - self.dates[0] + step
+        i, shift = self.backlog, np.timedelta64(0, "ms")
+        while not self._stopped.wait(1 / self.rate):
+            if time.time() - self.feed.last_read > IDLE_SECONDS:
+                break
+            if i == n:
+                i, shift = 0, shift + span  # loop the recording, keeping time monotonic
+            self.feed.publish(self.dates[i] + shift, self.closes[i], self.volumes[i])
+            i += 1
+
+    def stop(self):
+        self._stopped.set()
+
+
+class LiveHub:
+    """Process-wide live feeds, replayed from source(ticker) while someone reads them"""
+
+    def __init__(self, source, rate=REPLAY_RATE):
+        self.source = source
+        self.rate = rate
+        self._feeds = {}  # ticker -> (BarFeed, ReplayFeed)
+        self._lock = threading.Lock()
+
+    def feed(self, ticker):
+        """The running feed for a ticker, started on first use; None without bars"""
+        with self._lock:
+            running = self._running(ticker)
+        if running is not None:
+            return running
+        # Loading bars can be slow; other tickers' readers must not wait on it
+        bars = self.source(ticker)
+        if bars is None or bars.empty:
+            return None
+        with self._lock:
+            # Another reader may have started the feed while we were loading
+            running = self._running(ticker)
+            if running is not None:
+                return running
+            feed = BarFeed(ticker)
+            replay = ReplayFeed(feed, bars, self.rate)
+            replay.start()
+            self._feeds[ticker] = (feed, replay)
+            return feed
+
+    def _running(self, ticker):
+        entry = self._feeds.get(ticker)
+        if entry is not None and entry[1].is_alive():
+            return entry[0]
+        return None
+
+    def stop(self):
+        with self._lock:
+            for _, replay in self._feeds.values():
+                replay.stop()
+            self._feeds.clear()
@@ -0,0 +1,152 @@
+# -------------------------------------------------------------------
+# MEMORY-MAPPED SHARED HISTORY
+# -------------------------------------------------------------------
+# With several Streamlit server processes on one host, each process
+# would otherwise hold its own copy of every ticker's history. Here one
+# writer process publishes compact daily frames as uncompressed Arrow
+# IPC files, and every server process memory-maps them read-only: the
+# pandas columns point straight into the mapping, so the bytes live once
+# in the OS page cache no matter how many workers read them.
+#
+#   <MAPPED_STORE_DIR>/<TICKER>.arrow
+#
+# Files are replaced atomically (write to a temp name, then rename).
+# A reader notices a new file by its inode and re-maps it; frames handed
+# out earlier keep the old mapping alive until they are dropped. A lock
+# file ensures only one writer refreshes the directory at a time.
+#
+#   python mapped_store.py refresh --dir /dev/shm/stocks
+#   MAPPED_STORE_DIR=/dev/shm/stocks streamlit run main.py
+
+import argparse
+import fcntl
+import os
+import threading
+import time
+from datetime import date
+
+import pyarrow as pa
+
+from frame_memory import compact_frame
+
+MAPPED_STORE_DIR = os.environ.get("MAPPED_STORE_DIR")  # unset: each process loads its own frames
+LOCK_NAME = ".writer.lock"
+
+
+class WriterBusy(RuntimeError):
+    """Another process already holds the writer lock for the directory"""
+
+
+class MappedStore:
+    """Read side: zero-copy frames over memory-mapped Arrow files"""
+
+    def __init__(self, root=MAPPED_STORE_DIR):
+        self.root = root
+        self._frames = {}  # ticker -> ((inode, mtime), frame)
+        self._lock = threading.Lock()
+
+    def path(self, ticker):
+        return os.path.join(self.root, f"{ticker.upper()}.arrow")
+
+    def tickers(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(f[:-6] for f in os.listdir(self.root) if f.endswith(".arrow"))
+
+    def read(self, ticker):
+        """Shallow copy of the mapped frame for a ticker, or None if not published"""
+        try:
+            st = os.stat(self.path(ticker))
+        except FileNotFoundError:
+            return None
+        version = (st.st_ino, st.st_mtime_ns)
+        with self._lock:
+            entry = self._frames.get(ticker)
+            if entry is None or entry[0] != version:
+                entry = (version, self._map(ticker))
+                self._frames[ticker] = entry
+        return entry[1].copy(deep=False)
+
+    def _map(self, ticker):
+        source = pa.memory_map(self.path(ticker), "r")
+        table = pa.ipc.open_file(source).read_all()
+        # One chunk per column and no nulls, so every column is a view on the mapping
+        return table.to_pandas(split_blocks=True, zero_copy_only=True)
+
+
+class MappedWriter:
+    """Write side: the single process that refreshes the mapped files"""
+
+    def __init__(self, root=MAPPED_STORE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock_file = open(os.path.join(root, LOCK_NAME), "w")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._lock_file.close()
+            raise WriterBusy(f"another writer is refreshing {root}")
+
+    def write(self, ticker, df):
+        """Atomically replace one ticker's mapped file with a compact frame"""
+        table = pa.Table.from_pandas(compact_frame(df), preserve_index=False).combine_chunks()
+        path = os.path.join(self.root, f"{ticker.upper()}.arrow")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+
+    def publish(self, frames):
+        """Write every non-empty frame; returns the tickers written"""
+        written = []
+        for ticker, df in frames.items():
+            if not df.empty:
+                self.write(ticker, df)
+                written.append(ticker)
+        return written
+
+    def close(self):
+        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        self._lock_file.close()
+
+
+def refresh(writer, store, tickers, start):
+    """Sync the tickers through the history store and publish them"""
+    end = date.today().strftime("%Y-%m-%d")
+    return writer.publish(store.sync_many(tickers, start, end))
+
+
+def main():
+    from history_store import HistoryStore
+    from prefetch import REFRESH_SECONDS, UNIVERSE
+
+    parser = argparse.ArgumentParser(description="Publish memory-mapped daily histories")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("refresh", help="sync the universe and rewrite the mapped files")
+    run.add_argument("tickers", nargs="*", default=list(UNIVERSE))
+    run.add_argument("--dir", default=MAPPED_STORE_DIR, required=MAPPED_STORE_DIR is None)
+    run.add_argument("--start", default="2010-01-01")
+    run.add_argument("--every", type=int, default=REFRESH_SECONDS,
+                     help="seconds between refreshes; 0 to refresh once and exit")
+    args = parser.parse_args()
+
+    try:
+        writer = MappedWriter(args.dir)
+    except WriterBusy as e:
+        parser.exit(1, f"{e}\n")
+    store = HistoryStore()
+    try:
+        while True:
+            t0 = time.perf_counter()
+            written = refresh(writer, store, args.tickers, args.start)
+            print(f"published {len(written)} tickers to {args.dir} in {time.perf_counter() - t0:.1f}s")
+            if not args.every:
+                break
+            time.sleep(args.every)
+    finally:
+        writer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -------------------------------------------------------------------
+# US EQUITY MARKET CALENDAR
+# -------------------------------------------------------------------
+# NYSE full-day closures: the regular holiday rules plus the one-off
+# closures since 2001. The stores use it to tell a day that has no bars
+# because the market was shut from a download that silently came back
+# empty (yfinance logs its errors and returns an empty frame).
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+SPECIAL_CLOSURES = [
+    "2001-09-11", "2001-09-12", "2001-09-13", "2001-09-14",  # September 11
+    "2004-06-11",  # Reagan funeral
+    "2007-01-02",  # Ford funeral
+    "2012-10-29", "2012-10-30",  # Hurricane Sandy
+    "2018-12-05",  # G. H. W. Bush funeral
+    "2025-01-09",  # Carter funeral
+]
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    rules = [
+        # A Saturday New Year's Day is not observed on the Friday before
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+HOLIDAYS = NYSEHolidayCalendar().holidays("1990-01-01", "2099-12-31").union(pd.to_datetime(SPECIAL_CLOSURES))
+_HOLIDAY_DAYS = HOLIDAYS.values.astype("datetime64[D]")
+
+
+def trading_days(start, end):
+    """Sessions with start <= day < end"""
+    days = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    return days[~np.isin(days.values.astype("datetime64[D]"), _HOLIDAY_DAYS)]
+
+
+def is_trading_day(day):
+    return len(trading_days(day, pd.Timestamp(day) + pd.Timedelta(days=1))) == 1
+
+
+def expects_bars(start, end, today=None):
+    """True when [start, end) holds a completed session, so an empty download is a failure"""
+    today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+    return len(trading_days(start, min(pd.Timestamp(end), today))) > 0
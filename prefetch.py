@@ -0,0 +1,56 @@
+# -------------------------------------------------------------------
+# UNIVERSE PREFETCH
+# -------------------------------------------------------------------
+# The ticker selectbox offers a fixed universe. Instead of downloading
+# each symbol when it is selected, the whole universe is synced with one
+# batched multi-ticker download and published to the frame cache. A
+# background thread repeats this so switching tickers is a cache hit.
+
+import os
+import threading
+from datetime import date
+
+from frame_cache import OPEN_TTL
+from frame_memory import compact_frame
+
+UNIVERSE = (
+    "AAPL", "GOOG", "MSFT", "TSLA", "AMZN", "NVDA", "META", "NFLX", "AMD", "CRM",
+    "ORCL", "INTC", "CSCO", "ADBE", "PYPL", "UBER", "SPOT", "SQ", "SHOP", "COIN",
+)
+
+REFRESH_SECONDS = int(os.environ.get("PREFETCH_SECONDS", str(OPEN_TTL)))
+
+
+def prefetch_universe(store, cache, tickers, start, end, interval="1d"):
+    """Sync every ticker in one batch and publish the frames to the cache"""
+    frames = store.sync_many(tickers, start, end)
+    for ticker, df in frames.items():
+        if not df.empty:
+            cache.put((ticker, start, end, interval), compact_frame(df))
+    return frames
+
+
+class UniverseWarmer(threading.Thread):
+    """Daemon thread that keeps the universe fresh in the frame cache"""
+
+    def __init__(self, store, cache, tickers, start, every=REFRESH_SECONDS):
+        super().__init__(name="universe-warmer", daemon=True)
+        self.store = store
+        self.cache = cache
+        self.tickers = list(tickers)
+        self.start_date = start
+        self.every = every
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                end = date.today().strftime("%Y-%m-%d")
+                prefetch_universe(self.store, self.cache, self.tickers, self.start_date, end)
+            except Exception:
+                # Keep warming on the next cycle; sessions fall back to load_data
+                pass
+            self._stopped.wait(self.every)
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,15 @@
+# -------------------------------------------------------------------
+# PREFIX SUMS
+# -------------------------------------------------------------------
+# Window sums as the difference of two cumulative sums, so a statistic
+# over any [s, t) costs O(1) after one pass. The walk-forward refits and
+# the PELT segment costs are both built on it.
+
+import numpy as np
+
+
+def prefix_sums(values):
+    """Cumulative sums with a leading zero: sum(values[s:t]) == out[t] - out[s]"""
+    out = np.zeros(len(values) + 1)
+    np.cumsum(values, out=out[1:])
+    return out
@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------
+# MARKET DATA PROVIDERS
+# -------------------------------------------------------------------
+# load_data() goes through a provider instead of calling yfinance
+# directly. Every backend returns the same frame shape: flat OHLCV
+# columns with the bar timestamp in a "Date" column and a RangeIndex.
+#
+#   MARKET_DATA_PROVIDER=yahoo      (default) Yahoo Finance via yfinance
+#   MARKET_DATA_PROVIDER=local      Parquet/CSV files in MARKET_DATA_DIR
+#   MARKET_DATA_PROVIDER=synthetic  seeded random walk, for offline runs
+#
+# Every download takes an interval: "1d" or one of the intraday bar
+# sizes in INTERVALS. Intraday timestamps are New York wall-clock time.
+#
+# yfinance logs download errors and returns an empty frame, so the Yahoo
+# backend raises ProviderError when a range that held a completed
+# session comes back empty; the stores then keep their data and retry.
+
+import os
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from market_calendar import expects_bars
+from timeslice import date_slice
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"]
+INTERVALS = ("1d", "15m", "5m", "1m")
+BARS_PER_DAY = {"1d": 1, "15m": 26, "5m": 78, "1m": 390}  # regular session
+# How far back Yahoo serves each intraday size (days), and its max span per request
+INTRADAY_LOOKBACK = {"15m": 59, "5m": 59, "1m": 29}
+REQUEST_SPAN = {"15m": 59, "5m": 59, "1m": 7}
+
+
+class ProviderError(RuntimeError):
+    """A download failed (or came back empty for a range that must have bars)"""
+
+
+def normalize_frame(df):
+    """Flatten provider output into the frame shape load_data() returns"""
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    if "Date" not in df.columns:
+        df = df.reset_index()
+        # Intraday downloads index by "Datetime"
+        df = df.rename(columns={df.columns[0]: "Date"})
+    df.columns.name = None
+
+    df["Date"] = pd.to_datetime(df["Date"])
+    if df["Date"].dt.tz is not None:
+        df["Date"] = df["Date"].dt.tz_convert("America/New_York").dt.tz_localize(None)
+    df["Date"] = df["Date"].astype("datetime64[ns]")
+
+    columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+    return df[columns].sort_values("Date").reset_index(drop=True)
+
+
+def date_window(df, start, end):
+    """Rows with start <= Date < end, reindexed from zero"""
+    return date_slice(df, start, end, inclusive_end=False).reset_index(drop=True)
+
+
+class MarketDataProvider:
+    """Base class for OHLCV sources; end dates are exclusive like yf.download"""
+
+    name = "base"
+
+    def download(self, ticker, start, end, interval="1d"):
+        raise NotImplementedError
+
+    def download_many(self, tickers, start, end, interval="1d"):
+        """Return {ticker: frame, or None if its download failed}; tickers without bars are left out"""
+        frames = {}
+        for ticker in tickers:
+            try:
+                df = self.download(ticker, start, end, interval)
+            except Exception:
+                frames[ticker] = None
+                continue
+            if not df.empty:
+                frames[ticker] = df
+        return frames
+
+
+class YahooProvider(MarketDataProvider):
+    """Yahoo Finance through yfinance"""
+
+    name = "yahoo"
+
+    def download(self, ticker, start, end, interval="1d"):
+        import yfinance as yf
+
+        if interval != "1d":
+            return self._download_intraday(ticker, start, end, interval)
+        df = yf.download(ticker, start, end, progress=False)
+        if df.empty:
+            if expects_bars(start, end):
+                raise ProviderError(f"no daily bars for {ticker} in [{start}, {end})")
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return normalize_frame(df)
+
+    def _download_intraday(self, ticker, start, end, interval):
+        import yfinance as yf
+
+        # Yahoo caps the span of one intraday request (7 days for 1m bars)
+        frames = []
+        span = pd.Timedelta(days=REQUEST_SPAN[interval])
+        lo, end = pd.Timestamp(start), pd.Timestamp(end)
+        while lo < end:
+            hi = min(lo + span, end)
+            df = yf.download(ticker, lo, hi, interval=interval, progress=False)
+            if not df.empty:
+                frames.append(normalize_frame(df))
+            elif expects_bars(lo, hi):
+                raise ProviderError(f"no {interval} bars for {ticker} in [{lo:%Y-%m-%d}, {hi:%Y-%m-%d})")
+            lo = hi
+        if not frames:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return pd.concat(frames, ignore_index=True).drop_duplicates("Date")
+
+    def download_many(self, tickers, start, end, interval="1d"):
+        import yfinance as yf
+
+        if interval != "1d":
+            return super().download_many(tickers, start, end, interval)
+        df = yf.download(list(tickers), start, end, group_by="ticker", progress=False)
+        if not isinstance(df.columns, pd.MultiIndex):
+            parts = {tickers[0]: df} if len(tickers) == 1 else {}
+        else:
+            parts = {t: df[t].dropna(how="all") for t in df.columns.get_level_values(0).unique()}
+
+        # A ticker that failed inside the batch is missing or all-NaN: report it as None
+        expected = expects_bars(start, end)
+        frames = {}
+        for ticker in tickers:
+            part = parts.get(ticker)
+            if part is not None and not part.empty:
+                frames[ticker] = normalize_frame(part)
+            elif expected:
+                frames[ticker] = None
+        return frames
+
+
+class LocalFileProvider(MarketDataProvider):
+    """Serves OHLCV from <root>/<TICKER>.parquet or <root>/<TICKER>.csv"""
+
+    name = "local"
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, ticker, interval="1d"):
+        # Daily bars in TICKER.ext, intraday bars in TICKER_<interval>.ext
+        name = ticker.upper() if interval == "1d" else f"{ticker.upper()}_{interval}"
+        for ext in ("parquet", "csv"):
+            path = os.path.join(self.root, f"{name}.{ext}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def download(self, ticker, start, end, interval="1d"):
+        path = self.path(ticker, interval)
+        if path is None:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        if path.endswith(".parquet"):
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path)
+        return date_window(normalize_frame(df), start, end)
+
+
+class SyntheticProvider(MarketDataProvider):
+    """Deterministic business-day random walk seeded by the ticker symbol"""
+
+    name = "synthetic"
+
+    def __init__(self, first_date="2010-01-01"):
+        self.first_date = first_date
+
+    def download(self, ticker, start, end, interval="1d"):
+        if interval != "1d":
+            return self._intraday(ticker, start, end, interval)
+        # Generated from a fixed origin so any window of a ticker is identical
+        dates = pd.bdate_range(self.first_date, pd.to_datetime(end) - pd.Timedelta(days=1))
+        seed = zlib.crc32(ticker.upper().encode())
+        rngs = [np.random.default_rng([seed, i]) for i in range(4)]
+        n = len(dates)
+
+        close = 50 * np.exp(np.cumsum(rngs[0].normal(0.0004, 0.018, n)))
+        open_ = close * np.exp(rngs[1].normal(0, 0.005, n))
+        spread = np.abs(rngs[2].normal(0, 0.01, n))
+        df = pd.DataFrame({
+            "Date": dates,
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + spread),
+            "Low": np.minimum(open_, close) * (1 - spread),
+            "Close": close,
+            "Volume": rngs[3].integers(1_000_000, 50_000_000, n),
+        })
+        return date_window(normalize_frame(df), start, end)
+
+    def _intraday(self, ticker, start, end, interval):
+        # Each session is a Brownian bridge from the daily open to the daily
+        # close, seeded per (ticker, day), so intraday agrees with daily bars
+        daily = self.download(ticker, start, end)
+        if daily.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        per_day = BARS_PER_DAY[interval]
+        step = pd.Timedelta(minutes=390 // per_day)
+        seed = zlib.crc32(ticker.upper().encode())
+
+        frames = []
+        for day in daily.itertuples(index=False):
+            rng = np.random.default_rng([seed, int(day.Date.toordinal()), per_day])
+            walk = np.cumsum(rng.normal(0, 1, per_day))
+            bridge = walk - np.arange(1, per_day + 1) / per_day * walk[-1]
+            scale = 0.018 / np.sqrt(per_day) * day.Open
+            close = np.linspace(day.Open, day.Close, per_day + 1)[1:] + bridge * scale
+            open_ = np.concatenate([[day.Open], close[:-1]])
+            wick = np.abs(rng.normal(0, 0.002, per_day))
+            frames.append(pd.DataFrame({
+                "Date": day.Date + pd.Timedelta(hours=9, minutes=30) + step * np.arange(per_day),
+                "Open": open_,
+                "High": np.maximum(open_, close) * (1 + wick),
+                "Low": np.minimum(open_, close) * (1 - wick),
+                "Close": close,
+                "Volume": rng.multinomial(day.Volume, np.full(per_day, 1 / per_day)),
+            }))
+        return date_window(normalize_frame(pd.concat(frames, ignore_index=True)), start, end)
+
+
+def get_provider(name=None):
+    """Build the provider selected by name or MARKET_DATA_PROVIDER"""
+    name = name or os.environ.get("MARKET_DATA_PROVIDER", "yahoo")
+    if name == "yahoo":
+        return YahooProvider()
+    if name == "local":
+        return LocalFileProvider(os.environ.get("MARKET_DATA_DIR", "fixtures"))
+    if name == "synthetic":
+        return SyntheticProvider()
+    raise ValueError(f"Unknown market data provider: {name}")
@@ -0,0 +1,206 @@
+# -------------------------------------------------------------------
+# REGIME DETECTION (PELT CHANGE POINTS)
+# -------------------------------------------------------------------
+# Segments a price history into trend regimes (piecewise linear fits of
+# log price) and volatility regimes (piecewise constant variance of log
+# returns) with PELT, an exact optimal-partitioning search that prunes
+# candidate change points that can never win again. Segment costs come
+# from prefix sums, so each candidate costs O(1) to evaluate.
+#
+# PELT's optimum up to bar t only depends on bars <= t, so a fitted
+# search is resumed when new bars arrive instead of restarting; the
+# RegimeBook keeps one per (ticker, kind) the same way IndicatorBook
+# keeps indicator state.
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from prefix_sums import prefix_sums
+
+TRADING_DAYS = 252
+VAR_FLOOR = 1e-12
+
+# Per-kind defaults: minimum segment length (bars) and penalty per change point
+REGIME_KINDS = {
+    "trend": {"min_size": 40, "penalty": 150.0},
+    "volatility": {"min_size": 40, "penalty": 40.0},
+}
+
+
+class Pelt:
+    """Resumable PELT search over one series with an O(1) segment cost"""
+
+    def __init__(self, kind="trend", min_size=None, penalty=None):
+        if kind not in REGIME_KINDS:
+            raise ValueError(f"unknown regime kind {kind!r}")
+        self.kind = kind
+        self.min_size = min_size or REGIME_KINDS[kind]["min_size"]
+        self.penalty = penalty if penalty is not None else REGIME_KINDS[kind]["penalty"]
+        self.n = 0
+        self.sums = None  # prefix sums, one array per statistic
+        self.F = np.array([-self.penalty])  # F[t]: optimal cost of the first t values
+        self.last = np.array([0], dtype=np.int64)  # last change point before t
+        self.candidates = np.empty(0, dtype=np.int64)
+
+    # ---------------------------------------------------------------
+    # Segment costs on [s, t), vectorized over s
+    # ---------------------------------------------------------------
+    def _extend_sums(self, new):
+        start = self.n
+        x = np.arange(start, start + len(new), dtype=float)
+        if self.kind == "trend":
+            stats = (x, new, x * new, x * x, new * new)
+        else:
+            stats = (new, new * new)
+        if self.sums is None:
+            self.sums = [prefix_sums(v) for v in stats]
+        else:
+            self.sums = [np.concatenate([p, p[-1] + np.cumsum(v)]) for p, v in zip(self.sums, stats)]
+
+    def _cost(self, s, t):
+        m = (t - s).astype(float)
+        if self.kind == "trend":
+            sx, sy, sxy, sxx, syy = (p[t] - p[s] for p in self.sums)
+            cxx = sxx - sx * sx / m
+            cxy = sxy - sx * sy / m
+            sse = syy - sy * sy / m - np.where(cxx > 0, cxy * cxy / np.where(cxx > 0, cxx, 1), 0)
+        else:
+            sr, srr = (p[t] - p[s] for p in self.sums)
+            sse = srr - sr * sr / m
+        return m * np.log(np.maximum(sse / m, VAR_FLOOR))
+
+    # ---------------------------------------------------------------
+    # Search
+    # ---------------------------------------------------------------
+    def update(self, new_values):
+        """Append values and extend the optimal partition to cover them"""
+        new_values = np.asarray(new_values, dtype=float)
+        if not len(new_values):
+            return self
+        start = self.n
+        self._extend_sums(new_values)
+        self.n += len(new_values)
+
+        F = np.concatenate([self.F, np.full(len(new_values), np.inf)])
+        last = np.concatenate([self.last, np.zeros(len(new_values), dtype=np.int64)])
+        candidates = self.candidates
+        for t in range(start + 1, self.n + 1):
+            # The newest start point becomes admissible once its segment is long enough
+            s_new = t - self.min_size
+            if s_new >= 0 and np.isfinite(F[s_new]):
+                candidates = np.append(candidates, s_new)
+            if not len(candidates):
+                continue
+            seg = F[candidates] + self._cost(candidates, t)
+            best = int(np.argmin(seg))
+            F[t] = seg[best] + self.penalty
+            last[t] = candidates[best]
+            # Prune starts that cannot be optimal for any later t
+            candidates = candidates[seg <= F[t]]
+        self.F, self.last, self.candidates = F, last, candidates
+        return self
+
+    def breakpoints(self):
+        """Segment boundaries [0, b1, ..., n] of the optimal partition"""
+        if self.n == 0:
+            return [0]
+        t = self.n
+        if not np.isfinite(self.F[t]):
+            return [0, t]  # shorter than min_size: one segment
+        bounds = [t]
+        while t > 0:
+            t = int(self.last[t])
+            bounds.append(t)
+        return bounds[::-1]
+
+
+def regime_series(df, kind):
+    """The series a regime kind is detected on: log close or log returns"""
+    log_close = np.log(df["Close"].to_numpy(dtype=float))
+    if kind == "trend":
+        return log_close
+    returns = np.diff(log_close, prepend=log_close[:1])
+    return returns
+
+
+def segment_table(df, kind, bounds, periods_per_year=TRADING_DAYS):
+    """One row per regime with its dates, annualized slope/volatility and a label"""
+    dates = df["Date"].to_numpy()
+    log_close = np.log(df["Close"].to_numpy(dtype=float))
+    returns = np.diff(log_close, prepend=log_close[:1])
+    overall_vol = returns[1:].std() if len(returns) > 1 else 0.0
+
+    rows = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        x = np.arange(lo, hi, dtype=float)
+        y = log_close[lo:hi]
+        slope, intercept = np.polyfit(x, y, 1) if hi - lo > 1 else (0.0, y[0])
+        vol = returns[max(lo, 1):hi].std() if hi - max(lo, 1) > 1 else 0.0
+        annual = (np.exp(slope * periods_per_year) - 1) * 100
+        if kind == "trend":
+            label = "Uptrend" if annual > 10 else "Downtrend" if annual < -10 else "Sideways"
+        else:
+            label = ("High volatility" if vol > 1.25 * overall_vol
+                     else "Low volatility" if vol < 0.8 * overall_vol else "Normal volatility")
+        rows.append({
+            "Start": dates[lo],
+            "End": dates[hi - 1],
+            "Bars": hi - lo,
+            "Regime": label,
+            "Annual Trend %": annual,
+            "Annual Volatility %": vol * np.sqrt(periods_per_year) * 100,
+            "Slope": slope,
+            "Intercept": intercept,
+            "Start Bar": lo,
+        })
+    return pd.DataFrame(rows)
+
+
+def detect_regimes(df, kind="trend", min_size=None, penalty=None, periods_per_year=TRADING_DAYS):
+    """Regime table for a price history in one PELT pass"""
+    pelt = Pelt(kind, min_size, penalty).update(regime_series(df, kind))
+    return segment_table(df, kind, pelt.breakpoints(), periods_per_year)
+
+
+class RegimeBook:
+    """Per-ticker PELT searches that resume on new bars instead of restarting"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._books = OrderedDict()  # (ticker, kind) -> (last Date, bar count, Pelt, table), LRU order
+        self._lock = threading.Lock()
+
+    def regimes(self, ticker, df, kind="trend", periods_per_year=TRADING_DAYS):
+        """Regime table for df, reusing the search already run on its prefix"""
+        with self._lock:
+            return self._regimes(ticker, df, kind, periods_per_year)
+
+    def _regimes(self, ticker, df, kind, periods_per_year):
+        key = (ticker, kind)
+        entry = self._books.get(key)
+        if entry is not None:
+            last_date, n_old, pelt, table = entry
+            # Same history, possibly with new bars appended
+            if n_old <= len(df) and n_old and df["Date"].iloc[n_old - 1] == last_date:
+                if n_old == len(df):
+                    self._books.move_to_end(key)
+                    return table
+                pelt.update(regime_series(df, kind)[n_old:])
+                table = segment_table(df, kind, pelt.breakpoints(), periods_per_year)
+                self._remember(key, (df["Date"].iloc[-1], len(df), pelt, table))
+                return table
+
+        pelt = Pelt(kind).update(regime_series(df, kind))
+        table = segment_table(df, kind, pelt.breakpoints(), periods_per_year)
+        if len(df):
+            self._remember(key, (df["Date"].iloc[-1], len(df), pelt, table))
+        return table
+
+    def _remember(self, key, entry):
+        self._books[key] = entry
+        self._books.move_to_end(key)
+        while len(self._books) > self.max_entries:
+            self._books.popitem(last=False)
@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------
+# UNIVERSE SCREENER
+# -------------------------------------------------------------------
+# Runs generate_recommendation for every symbol of a universe on a
+# process pool. Tickers are sent to workers in chunks: each worker syncs
+# its chunk with one batched history load and scores it, and results are
+# yielded chunk by chunk as soon as they finish. fan_out() is the same
+# chunked fan-out for any worker; the backtest and walk-forward CLIs
+# use it too.
+#
+#   python screener.py AAPL MSFT NVDA --days 30 --workers 4
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from analysis import generate_recommendation, predict_prices
+from history_store import HistoryStore
+
+CHUNK_SIZE = 25
+SCREENER_COLUMNS = [
+    "Ticker", "Recommendation", "Score", "Confidence", "Expected Change %", "Price", "Reasons",
+]
+
+
+def load_universe(path=None):
+    """Tickers from a text/CSV file (one per line or comma separated)"""
+    path = path or os.environ.get("SCREENER_UNIVERSE")
+    if not path:
+        from prefetch import UNIVERSE
+        return list(UNIVERSE)
+    with open(path) as f:
+        text = f.read().replace(",", "\n")
+    return [t.strip().upper() for t in text.splitlines() if t.strip()]
+
+
+def score_frame(ticker, df, days_ahead=30):
+    """One screener row for an already-loaded price history"""
+    _, predictions = predict_prices(df, days_ahead)
+    rec = generate_recommendation(df, predictions)
+    return {
+        "Ticker": ticker,
+        "Recommendation": rec["recommendation"],
+        "Score": rec["score"],
+        "Confidence": rec["confidence"],
+        "Expected Change %": round(rec["price_change_pct"], 2),
+        "Price": round(float(df["Close"].iloc[-1]), 2),
+        "Reasons": "; ".join(rec["reasons"]),
+    }
+
+
+def screen_chunk(tickers, start, end, days_ahead=30):
+    """Worker entry point: load and score a chunk of tickers"""
+    frames = HistoryStore().sync_many(tickers, start, end)
+    rows = []
+    for ticker in tickers:
+        df = frames.get(ticker)
+        try:
+            if df is None or len(df) < 60:
+                raise ValueError("not enough history")
+            rows.append(score_frame(ticker, df, days_ahead))
+        except Exception as e:
+            rows.append({"Ticker": ticker, "Recommendation": f"⚠️ {e}"})
+    return rows
+
+
+def make_pool(max_workers=None):
+    # spawn: never fork a multithreaded Streamlit server
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def fan_out(worker, tickers, *args, pool=None, chunk_size=None):
+    """Yield worker(chunk, *args) for chunks of tickers as each finishes on the pool"""
+    if chunk_size is None:
+        # Several chunks per core keeps every worker busy until the end
+        chunk_size = max(1, min(CHUNK_SIZE, -(-len(tickers) // (4 * (os.cpu_count() or 1)))))
+    own_pool = pool is None
+    pool = pool or make_pool()
+    try:
+        futures = [
+            pool.submit(worker, tickers[i:i + chunk_size], *args)
+            for i in range(0, len(tickers), chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        if own_pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def run_screener(tickers, start, end, days_ahead=30, pool=None, chunk_size=None):
+    """Yield lists of screener rows as each chunk of tickers completes"""
+    yield from fan_out(screen_chunk, tickers, start, end, days_ahead, pool=pool, chunk_size=chunk_size)
+
+
+def main():
+    from datetime import date
+
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Score a ticker universe in parallel")
+    parser.add_argument("tickers", nargs="*", help="defaults to SCREENER_UNIVERSE or the app universe")
+    parser.add_argument("--universe", help="file with one ticker per line")
+    parser.add_argument("--start", default="2010-01-01")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    tickers = [t.upper() for t in args.tickers] or load_universe(args.universe)
+    end = date.today().strftime("%Y-%m-%d")
+    rows = []
+    with make_pool(args.workers) as pool:
+        for chunk in run_screener(tickers, args.start, end, args.days, pool=pool):
+            rows.extend(chunk)
+    table = pd.DataFrame(rows, columns=SCREENER_COLUMNS).sort_values("Score", ascending=False)
+    print(table.drop(columns="Reasons").to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -------------------------------------------------------------------
+# SEASONAL DECOMPOSITION
+# -------------------------------------------------------------------
+# Splits a close series into trend + seasonal + residual.
+#
+# Periods are found from the periodogram of log returns (differencing
+# flattens the random-walk spectrum that would otherwise bury any cycle
+# under low frequencies). A peak counts only if its power beats the
+# median by more than chance allows across all the frequencies tested.
+#
+# The decomposition is the classical moving-average one, extended to
+# several periods the way MSTL does: each seasonal component is
+# re-estimated on the series with the other components removed, for a
+# couple of passes. The trend is a centered moving average whose window
+# shrinks at the ends, so no bars are lost at the edges; with no period
+# it falls back to a TREND_WINDOW-bar smoothing. Everything is
+# array arithmetic (FFT, convolution, bincount); nothing loops per bar.
+
+import numpy as np
+import pandas as pd
+
+PASSES = 2  # backfitting passes when there are several periods
+FALSE_PEAK_RATE = 0.01  # chance of reporting a period in pure noise
+MIN_CYCLES = 3  # a period must repeat this often within the range
+TREND_WINDOW = 30  # trend smoothing (bars) when there is no seasonal period
+
+
+def periodogram(close):
+    """(periods, power) of the log returns, longest period first"""
+    returns = np.diff(np.log(np.asarray(close, dtype=float)))
+    returns = returns - returns.mean()
+    power = np.abs(np.fft.rfft(returns * np.hanning(len(returns)))) ** 2
+    freqs = np.fft.rfftfreq(len(returns))
+    return 1 / freqs[1:], power[1:]
+
+
+def detect_periods(close, max_periods=2, min_period=2):
+    """[(period, strength)] of significant cycles, strongest first"""
+    if len(close) < 2 * MIN_CYCLES * min_period:
+        return []
+    periods, power = periodogram(close)
+    ok = (periods >= min_period) & (periods <= len(close) / MIN_CYCLES)
+    if ok.sum() < 3:
+        return []
+    # Periodogram ordinates of noise are ~exponential: P(power > k * median) = 2**-k
+    strength = power / np.median(power[ok])
+    threshold = np.log2(ok.sum() / FALSE_PEAK_RATE)
+
+    peak = np.zeros_like(ok)
+    peak[1:-1] = (power[1:-1] >= power[:-2]) & (power[1:-1] >= power[2:])
+    found = []
+    for i in np.argsort(-strength):
+        if not (ok[i] and peak[i]) or strength[i] < threshold:
+            continue
+        period = int(round(periods[i]))
+        if any(abs(period - p) <= 0.1 * p for p, _ in found):
+            continue  # the same cycle seen in a neighbouring bin
+        found.append((period, float(strength[i])))
+        if len(found) == max_periods:
+            break
+    return found
+
+
+def centered_mean(values, window):
+    """Centered moving average; 2xm weights for even windows, shrinking at the ends"""
+    # The kernel must not outgrow the series: np.convolve "same" returns the longer length
+    window = min(window, len(values) - 1 + len(values) % 2)
+    if window <= 1:
+        return values.copy()
+    kernel = np.ones(window + 1 - window % 2)
+    if window % 2 == 0:
+        kernel[[0, -1]] = 0.5
+    total = np.convolve(values, kernel, mode="same")
+    weight = np.convolve(np.ones(len(values)), kernel, mode="same")
+    return total / weight
+
+
+def seasonal_profile(detrended, period):
+    """Mean detrended value per phase of the period, centered on zero, tiled to full length"""
+    phase = np.arange(len(detrended)) % period
+    means = np.bincount(phase, weights=detrended, minlength=period) / np.bincount(phase, minlength=period)
+    return (means - means.mean())[phase]
+
+
+def decompose(dates, close, periods):
+    """Frame of Date, Close, Trend, one Seasonal column per period and Residual"""
+    x = np.asarray(close, dtype=float)
+    periods = sorted(set(int(p) for p in periods if 2 <= p <= len(x) // 2))
+    seasonals = {p: np.zeros_like(x) for p in periods}
+
+    for _ in range(PASSES if len(periods) > 1 else 1):
+        for p in periods:
+            base = x - sum(seasonals[q] for q in periods if q != p)
+            seasonals[p] = seasonal_profile(base - centered_mean(base, p), p)
+
+    seasonal = sum(seasonals.values()) if periods else np.zeros_like(x)
+    trend = centered_mean(x - seasonal, max(periods) if periods else TREND_WINDOW)
+
+    out = pd.DataFrame({"Date": np.asarray(dates), "Close": x, "Trend": trend})
+    for p in periods:
+        out[f"Seasonal {p}"] = seasonals[p]
+    out["Residual"] = x - trend - seasonal
+    return out
+
+
+def seasonal_strength(parts):
+    """1 - Var(residual) / Var(seasonal + residual) per seasonal column (0 = none)"""
+    resid = parts["Residual"].to_numpy()
+    out = {}
+    for col in parts.columns:
+        if col.startswith("Seasonal "):
+            combined = parts[col].to_numpy() + resid
+            var = combined.var()
+            out[col] = max(0.0, 1 - resid.var() / var) if var > 0 else 0.0
+    return out
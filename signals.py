@@ -0,0 +1,71 @@
+# -------------------------------------------------------------------
+# VECTORIZED SIGNAL DETECTION
+# -------------------------------------------------------------------
+# Crossover and band-touch events computed with whole-array comparisons
+# instead of per-row .iloc lookups. NaN inputs (e.g. the warm-up rows of
+# a rolling mean) never produce an event, the same as the original loop.
+#
+# Events match the loop run on the same values. The page feeds compact
+# float32 closes and indicator columns, so a crossing that lands within
+# float32 rounding of a tie can differ from one found on float64 data.
+
+import numpy as np
+import pandas as pd
+
+
+def _values(series):
+    return np.asarray(series, dtype=float)
+
+
+def cross_above(a, b):
+    """True where a moves above b: a > b now and a <= b on the previous bar"""
+    a, b = _values(a), _values(b)
+    out = np.zeros(len(a), dtype=bool)
+    out[1:] = (a[1:] > b[1:]) & (a[:-1] <= b[:-1])
+    return out
+
+
+def cross_below(a, b):
+    """True where a moves below b: a < b now and a >= b on the previous bar"""
+    a, b = _values(a), _values(b)
+    out = np.zeros(len(a), dtype=bool)
+    out[1:] = (a[1:] < b[1:]) & (a[:-1] >= b[:-1])
+    return out
+
+
+def marker_values(mask, values):
+    """Marker array for Plotly: the value where mask is set, NaN elsewhere"""
+    return np.where(mask, _values(values), np.nan)
+
+
+def crossovers(df, indicator, price="Close"):
+    """Buy/sell masks for price crossing an indicator column"""
+    return {
+        "buy": cross_above(df[price], df[indicator]),
+        "sell": cross_below(df[price], df[indicator]),
+    }
+
+
+def bollinger_touches(df, price="Close", upper="UB", lower="LB"):
+    """Masks for bars where price moves onto or outside a Bollinger band"""
+    p, ub, lb = _values(df[price]), _values(df[upper]), _values(df[lower])
+    touch_upper = np.zeros(len(p), dtype=bool)
+    touch_lower = np.zeros(len(p), dtype=bool)
+    touch_upper[1:] = (p[1:] >= ub[1:]) & (p[:-1] < ub[:-1])
+    touch_lower[1:] = (p[1:] <= lb[1:]) & (p[:-1] > lb[:-1])
+    return {"upper": touch_upper, "lower": touch_lower}
+
+
+def events_table(df, signals, price="Close"):
+    """One row per event: Date, Signal name and the price at that bar"""
+    frames = []
+    for name, mask in signals.items():
+        idx = np.flatnonzero(mask)
+        frames.append(pd.DataFrame({
+            "Date": df["Date"].to_numpy()[idx],
+            "Signal": name,
+            "Price": _values(df[price])[idx],
+        }))
+    if not frames:
+        return pd.DataFrame(columns=["Date", "Signal", "Price"])
+    return pd.concat(frames, ignore_index=True).sort_values("Date", ignore_index=True)
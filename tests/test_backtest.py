@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import backtest, backtest_frame, signal_positions, summarize, trade_returns
+from providers import SyntheticProvider
+
+
+def frame(closes):
+    return pd.DataFrame({"Date": pd.bdate_range("2024-01-01", periods=len(closes)), "Close": closes})
+
+
+def crossing_closes():
+    # Flat at 100, a jump above the SMA20, then a drop below it
+    return np.r_[np.full(25, 100.0), np.full(10, 110.0), np.full(10, 90.0)]
+
+
+@pytest.mark.parametrize("allow_short, exit_level", [(False, 0.0), (True, -1.0)])
+def test_crossovers_hold_until_the_opposite_signal(allow_short, exit_level):
+    positions = signal_positions(frame(crossing_closes()), "sma", allow_short)
+    expected = np.r_[np.zeros(25), np.ones(10), np.full(10, exit_level)]
+    np.testing.assert_array_equal(positions, expected)
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        signal_positions(frame(crossing_closes()), "macd")
+
+
+def test_costs_are_charged_per_unit_of_position_change():
+    closes = np.array([100.0, 110.0, 121.0, 121.0])
+    positions = np.array([1.0, 1.0, -1.0, 0.0])
+    free = backtest_frame(frame(closes), positions, cost_bps=0)
+    costly = backtest_frame(frame(closes), positions, cost_bps=10)
+
+    # Long from the first close earns +10%, the short from bar 2 earns 0%
+    np.testing.assert_allclose(free["Strategy Return"], [0.0, 0.1, 0.1, 0.0])
+    np.testing.assert_allclose(costly["Traded"], [1, 0, 2, 1])
+    np.testing.assert_allclose(free["Strategy Return"] - costly["Strategy Return"], [0.001, 0, 0.002, 0.001])
+
+
+def test_short_positions_earn_falling_prices():
+    result = backtest_frame(frame(np.array([100.0, 90.0, 81.0])), np.array([-1.0, -1.0, 0.0]), cost_bps=0)
+    np.testing.assert_allclose(result["Strategy Return"], [0.0, 0.1, 0.1])
+
+
+def test_trade_returns_compound_each_round_trip():
+    result = backtest_frame(frame(np.array([100.0, 110.0, 121.0, 121.0, 100.0, 50.0])),
+                            np.array([1.0, 1.0, 0.0, -1.0, 0.0, 0.0]), cost_bps=0)
+    np.testing.assert_allclose(trade_returns(result), [0.21, 1 - 100 / 121])
+    assert len(trade_returns(backtest_frame(frame(np.array([1.0, 2.0])), np.zeros(2)))) == 0
+
+
+def test_summarize_annualizes_by_bars_per_year():
+    closes = 100 * 1.001 ** np.arange(253) * (1 + 0.01 * (np.arange(253) % 2))
+    result = backtest_frame(frame(closes), np.ones(253), cost_bps=0)
+    daily = summarize(result)
+    intraday = summarize(result, periods_per_year=252 * 78)
+
+    assert daily["Total Return %"] == pytest.approx(intraday["Total Return %"])
+    assert daily["CAGR %"] == pytest.approx(daily["Total Return %"])  # exactly one year of bars
+    assert intraday["Sharpe"] == pytest.approx(daily["Sharpe"] * np.sqrt(78))
+    assert intraday["Turnover"] == pytest.approx(daily["Turnover"] * 78)  # per year, and 252 bars are 1/78 of one
+    assert daily["Trades"] == 1 and daily["Exposure %"] == pytest.approx(252 / 253 * 100)
+
+
+def test_backtest_runs_every_strategy():
+    df = SyntheticProvider().download("AAPL", "2020-01-01", "2022-01-01")
+    for strategy in ("ai", "sma", "ema"):
+        result, metrics = backtest(df, strategy, allow_short=True)
+        assert len(result) == len(df)
+        assert set(np.unique(result["Position"])) <= {-1.0, 0.0, 1.0}
+        assert metrics["Max Drawdown %"] <= 0
@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+
+import pandas as pd
+
+from bar_store import IntradayStore
+from providers import OHLCV_COLUMNS, SyntheticProvider
+
+
+class FlakyProvider(SyntheticProvider):
+    """Synthetic bars, or the empty frame yfinance returns after a swallowed error"""
+
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+
+    def download(self, ticker, start, end, interval="1d"):
+        if self.failing:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return super().download(ticker, start, end, interval)
+
+
+def window():
+    today = date.today()
+    return (today - timedelta(days=14)).isoformat(), (today - timedelta(days=1)).isoformat()
+
+
+def test_failed_download_is_retried(tmp_path):
+    start, end = window()
+    provider = FlakyProvider()
+    store = IntradayStore(str(tmp_path / "flaky"), provider)
+    assert store.sync("AAPL", "15m", start, end).empty
+    assert store.days("AAPL", "15m") == []
+
+    provider.failing = False
+    bars = store.sync("AAPL", "15m", start, end)
+    fresh = IntradayStore(str(tmp_path / "fresh"), SyntheticProvider()).sync("AAPL", "15m", start, end)
+    assert len(bars) > 0
+    pd.testing.assert_frame_equal(bars, fresh)
+
+
+def test_holiday_is_stored_empty(tmp_path):
+    provider = FlakyProvider()  # the market was closed, so nothing comes back
+    store = IntradayStore(str(tmp_path), provider)
+    store.sync("AAPL", "15m", "2024-12-25", "2024-12-26")
+    assert store.days("AAPL", "15m") == ["2024-12-25"]
+    assert store._missing_runs("AAPL", "15m", "2024-12-25", "2024-12-26") == []
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from analysis import predict_prices
+from analysis_context import AnalysisContext
+from forecast import MAX_HORIZON, PredictionFan
+from providers import SyntheticProvider
+
+
+def per_call_prediction(df, days_ahead):
+    """predict_prices as it was before the fan: one fit per call"""
+    X = np.arange(len(df)).reshape(-1, 1)
+    model = LinearRegression().fit(X, df["Close"].values)
+    future_days = np.arange(len(df), len(df) + days_ahead).reshape(-1, 1)
+    future_dates = pd.date_range(start=df["Date"].max() + pd.Timedelta(days=1), periods=days_ahead)
+    return future_dates, model.predict(future_days)
+
+
+@pytest.fixture(scope="module")
+def history():
+    return SyntheticProvider().download("AAPL", "2018-01-01", "2024-01-01")
+
+
+@pytest.mark.parametrize("days_ahead", [1, 7, 30, MAX_HORIZON, MAX_HORIZON + 1, 250])
+def test_fan_matches_per_call_prediction(history, days_ahead):
+    dates, expected = per_call_prediction(history, days_ahead)
+    for future_dates, predictions in (
+        predict_prices(history, days_ahead),
+        AnalysisContext(history).predictions(days_ahead),
+    ):
+        np.testing.assert_array_equal(predictions, expected)
+        assert future_dates.equals(dates)
+
+
+def test_fan_slices_every_horizon_from_one_fit(history):
+    fan = PredictionFan(history)
+    _, full = per_call_prediction(history, MAX_HORIZON)
+    for days_ahead in range(1, MAX_HORIZON + 1):
+        np.testing.assert_array_equal(fan.horizon(days_ahead)[1], full[:days_ahead])
+    with pytest.raises(ValueError):
+        fan.horizon(MAX_HORIZON + 1)
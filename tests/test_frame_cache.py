@@ -0,0 +1,100 @@
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from frame_cache import MARKET_TZ, OPEN_TTL, FrameCache, expiry_for, frame_nbytes
+
+
+def frame(n=1000):
+    return pd.DataFrame({"Close": np.arange(n, dtype=float)})
+
+
+def ny(*args):
+    return datetime(*args, tzinfo=MARKET_TZ).timestamp()
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_under_the_byte_budget():
+    size = frame_nbytes(frame())
+    cache = FrameCache(max_bytes=3 * size)
+    for key in "abc":
+        cache.put(key, frame())
+    cache.get("a")  # a is now the most recently used
+    cache.put("d", frame())
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    assert cache.nbytes == 3 * size
+    cache.put("e", frame())
+    assert cache.get("a") is None  # the least recently used after the reads above
+
+
+def test_frame_larger_than_the_budget_is_not_cached():
+    cache = FrameCache(max_bytes=frame_nbytes(frame()) - 1)
+    cache.put("a", frame())
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_expiry_follows_market_hours():
+    wednesday_open = ny(2024, 3, 6, 10, 0)
+    assert expiry_for(wednesday_open) == wednesday_open + OPEN_TTL
+    assert expiry_for(ny(2024, 3, 6, 8, 0)) == ny(2024, 3, 6, 9, 30)  # before the open
+    assert expiry_for(ny(2024, 3, 6, 16, 0)) == ny(2024, 3, 7, 9, 30)  # at the close
+    assert expiry_for(ny(2024, 3, 8, 17, 0)) == ny(2024, 3, 11, 9, 30)  # Friday evening
+    assert expiry_for(ny(2024, 3, 9, 12, 0)) == ny(2024, 3, 11, 9, 30)  # Saturday
+
+
+def test_entries_expire_across_open_and_close():
+    clock = Clock(ny(2024, 3, 6, 15, 58))
+    cache = FrameCache(clock=clock)
+    cache.put("open", frame())
+    clock.now += OPEN_TTL - 1
+    assert cache.get("open") is not None
+    clock.now += 1
+    assert cache.get("open") is None
+
+    clock.now = ny(2024, 3, 6, 16, 30)
+    cache.put("closed", frame())
+    clock.now = ny(2024, 3, 7, 9, 29)
+    assert cache.get("closed") is not None
+    clock.now = ny(2024, 3, 7, 9, 30)
+    assert cache.get("closed") is None
+    assert len(cache) == 0
+
+
+def test_concurrent_misses_load_once():
+    cache = FrameCache()
+    calls = []
+    start = threading.Barrier(8)
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return frame()
+
+    results = [None] * 8
+
+    def get(i):
+        start.wait()
+        results[i] = cache.get_or_load("AAPL", loader)
+
+    threads = [threading.Thread(target=get, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is not None and r.equals(frame()) for r in results)
+    # Every session gets a view of the one cached frame
+    assert all(np.shares_memory(r["Close"].to_numpy(), results[0]["Close"].to_numpy()) for r in results)
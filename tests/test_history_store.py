@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from history_store import HistoryStore
+from providers import OHLCV_COLUMNS, ProviderError, SyntheticProvider, YahooProvider
+
+
+class FlakyProvider(SyntheticProvider):
+    """Synthetic bars, or a failure in one of the two shapes yfinance produces"""
+
+    def __init__(self):
+        super().__init__()
+        self.failure = None  # None, "empty" or "raise"
+
+    def download(self, ticker, start, end, interval="1d"):
+        if self.failure == "raise":
+            raise ProviderError("rate limited")
+        if self.failure == "empty":
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return super().download(ticker, start, end, interval)
+
+
+@pytest.fixture
+def stale_store(tmp_path):
+    """A store synced up to a month ago, last stamped on an earlier day"""
+    provider = FlakyProvider()
+    store = HistoryStore(str(tmp_path), provider)
+    store.sync("AAPL", "2024-01-01", (date.today() - timedelta(days=30)).isoformat())
+    meta_path = store._path("AAPL", "json")
+    with open(meta_path, "w") as f:
+        f.write('{"start": "2024-01-01", "synced": "2000-01-01"}')
+    return store, provider
+
+
+@pytest.mark.parametrize("failure", ["empty", "raise"])
+@pytest.mark.parametrize("batched", [False, True])
+def test_failed_delta_is_retried(stale_store, failure, batched):
+    store, provider = stale_store
+    end = date.today().isoformat()
+    sync = (lambda: store.sync_many(["AAPL"], "2024-01-01", end)["AAPL"]) if batched else (
+        lambda: store.sync("AAPL", "2024-01-01", end))
+    stored_rows = len(store.read("AAPL"))
+
+    provider.failure = failure
+    assert len(sync()) == stored_rows
+    assert store.read_meta("AAPL")["synced"] == "2000-01-01"
+
+    provider.failure = None
+    assert len(sync()) > stored_rows
+    assert store.read_meta("AAPL")["synced"] == date.today().isoformat()
+
+
+def test_yahoo_raises_on_swallowed_errors(monkeypatch):
+    yfinance = pytest.importorskip("yfinance")
+    monkeypatch.setattr(yfinance, "download", lambda *args, **kwargs: pd.DataFrame())
+    with pytest.raises(ProviderError):
+        YahooProvider().download("AAPL", "2024-03-04", "2024-03-09")
+    with pytest.raises(ProviderError):
+        YahooProvider().download("AAPL", "2024-03-04", "2024-03-09", interval="5m")
+    # Nothing to expect over a holiday weekend
+    assert YahooProvider().download("AAPL", "2024-03-29", "2024-04-01").empty
+
+
+def test_ticker_failing_inside_a_batch_is_retried(stale_store):
+    store, provider = stale_store
+    end = date.today().isoformat()
+    stored_rows = len(store.read("AAPL"))
+    download_many = provider.download_many
+    provider.download_many = lambda tickers, *args: {**download_many(tickers, *args), "AAPL": None}
+
+    frames = store.sync_many(["AAPL"], "2024-01-01", end)
+    assert len(frames["AAPL"]) == stored_rows
+    assert store.read_meta("AAPL")["synced"] == "2000-01-01"
+
+
+def test_yahoo_batch_reports_failed_tickers(monkeypatch):
+    yfinance = pytest.importorskip("yfinance")
+    good = SyntheticProvider().download("AAPL", "2024-03-04", "2024-03-09").set_index("Date")
+    batch = pd.concat({"AAPL": good, "MSFT": good * float("nan")}, axis=1)
+    monkeypatch.setattr(yfinance, "download", lambda *args, **kwargs: batch)
+
+    frames = YahooProvider().download_many(["AAPL", "MSFT", "NVDA"], "2024-03-04", "2024-03-09")
+    assert len(frames["AAPL"]) == 5
+    assert frames["MSFT"] is None and frames["NVDA"] is None
+
+
+def test_failed_first_load_returns_no_bars(tmp_path):
+    provider = FlakyProvider()
+    provider.failure = "raise"
+    store = HistoryStore(str(tmp_path), provider)
+    assert store.sync("AAPL", "2024-01-01", "2024-02-01").empty
+    assert store.read("AAPL") is None
+
+    provider.failure = None
+    assert len(store.sync("AAPL", "2024-01-01", "2024-02-01")) > 0
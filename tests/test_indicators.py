@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import rsi_series
+from indicators import INDICATOR_COLUMNS, IndicatorBook, IndicatorState, indicator_frame
+from providers import SyntheticProvider
+
+
+def full_recompute(closes):
+    expected = indicator_frame(closes)
+    expected["RSI"] = rsi_series(pd.Series(closes)).to_numpy()
+    return expected[INDICATOR_COLUMNS]
+
+
+@pytest.mark.parametrize("seed_bars", [0, 1, 25, 1500])
+def test_streaming_matches_full_recompute(seed_bars):
+    # Long enough to cross RESUM_EVERY on the streamed part
+    closes = SyntheticProvider().download("MSFT", "2012-01-01", "2022-01-01")["Close"].to_numpy()
+    state = IndicatorState.from_history(closes[:seed_bars])
+    streamed = pd.DataFrame([state.update(c) for c in closes[seed_bars:]], columns=INDICATOR_COLUMNS)
+
+    expected = full_recompute(closes).iloc[seed_bars:].reset_index(drop=True)
+    np.testing.assert_allclose(streamed.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+def test_indicator_book_keeps_the_most_recent_series():
+    book = IndicatorBook(max_entries=2)
+    frames = {t: SyntheticProvider().download(t, "2023-01-01", "2024-01-01") for t in ("AAPL", "MSFT", "NVDA")}
+    book.columns("AAPL", frames["AAPL"])
+    book.columns("MSFT", frames["MSFT"])
+    book.columns("AAPL", frames["AAPL"])  # AAPL is now the most recently used
+    book.columns("NVDA", frames["NVDA"])
+    assert list(book._books) == ["AAPL", "NVDA"]
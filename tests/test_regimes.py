@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from providers import SyntheticProvider
+from regimes import Pelt, RegimeBook, detect_regimes, regime_series
+
+
+@pytest.fixture(scope="module")
+def history():
+    return SyntheticProvider().download("NVDA", "2015-01-01", "2020-01-01")
+
+
+@pytest.mark.parametrize("kind", ["trend", "volatility"])
+def test_resumed_search_matches_fresh_search(history, kind):
+    values = regime_series(history, kind)
+    resumed = Pelt(kind)
+    for lo in range(0, len(values), 97):
+        resumed.update(values[lo:lo + 97])
+    assert resumed.breakpoints() == Pelt(kind).update(values).breakpoints()
+
+
+@pytest.mark.parametrize("kind", ["trend", "volatility"])
+def test_regime_book_matches_detect_regimes_on_new_bars(history, kind):
+    book = RegimeBook()
+    book.regimes("NVDA", history.iloc[:900], kind)
+    table = book.regimes("NVDA", history, kind)
+    pd.testing.assert_frame_equal(table, detect_regimes(history, kind))
+
+
+def test_regime_book_keeps_the_most_recent_searches(history):
+    book = RegimeBook(max_entries=2)
+    for ticker in ("AAPL", "MSFT", "AAPL", "NVDA"):
+        book.regimes(ticker, history, "volatility")
+    assert list(book._books) == [("AAPL", "volatility"), ("NVDA", "volatility")]
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from analysis import generate_recommendation, predict_prices, score_history
+from providers import SyntheticProvider
+
+
+@pytest.mark.parametrize("ticker", ["AAPL", "NVDA"])
+@pytest.mark.parametrize("days_ahead", [7, 30])
+def test_score_history_matches_per_date_loop(ticker, days_ahead):
+    df = SyntheticProvider().download(ticker, "2020-01-01", "2021-07-01")
+    timeline = score_history(df, days_ahead)
+    assert len(timeline) == len(df) - 29
+
+    for i, row in enumerate(timeline.to_dict("records"), start=29):
+        history = df.iloc[:i + 1]
+        _, predictions = predict_prices(history, days_ahead)
+        rec = generate_recommendation(history, predictions)
+        assert row["Date"] == history["Date"].iloc[-1]
+        assert row["Score"] == rec["score"], f"bar {i}"
+        assert row["Recommendation"] == rec["recommendation"], f"bar {i}"
+        assert row["Confidence"] == rec["confidence"], f"bar {i}"
+        assert np.isclose(row["Expected Change %"], rec["price_change_pct"]), f"bar {i}"
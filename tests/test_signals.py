@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from signals import bollinger_touches, cross_above, cross_below, crossovers, events_table, marker_values
+
+
+def random_frame(dtype, seed=7, n=400):
+    rng = np.random.default_rng(seed)
+    # Prices on a coarse grid so the close often ties the indicator exactly
+    close = 100 + np.round(np.cumsum(rng.normal(0, 1, n)), 0)
+    df = pd.DataFrame({"Date": pd.bdate_range("2020-01-01", periods=n), "Close": close})
+    df["SMA20"] = df["Close"].rolling(20).mean().round(0)  # NaN warm-up rows
+    df["EMA20"] = df["Close"].ewm(span=20, adjust=False).mean().round(0)
+    std = df["Close"].rolling(20).std().round(0)
+    df["UB"], df["LB"] = df["SMA20"] + 2 * std, df["SMA20"] - 2 * std
+    return df.astype({c: dtype for c in ["Close", "SMA20", "EMA20", "UB", "LB"]})
+
+
+def loop_events(df, indicator):
+    """The per-row crossover loop the signals module replaced (buy), plus its sell mirror"""
+    buy, sell = [], []
+    for i in range(len(df)):
+        buy.append(None)
+        sell.append(None)
+        if i == 0:
+            continue
+        if df["Close"].iloc[i] > df[indicator].iloc[i] and df["Close"].iloc[i - 1] <= df[indicator].iloc[i - 1]:
+            buy[i] = df["Close"].iloc[i]
+        if df["Close"].iloc[i] < df[indicator].iloc[i] and df["Close"].iloc[i - 1] >= df[indicator].iloc[i - 1]:
+            sell[i] = df["Close"].iloc[i]
+    return buy, sell
+
+
+def as_markers(values):
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("indicator", ["SMA20", "EMA20"])
+def test_crossovers_match_the_loop(dtype, indicator):
+    df = random_frame(dtype)
+    buy, sell = loop_events(df, indicator)
+    signals = crossovers(df, indicator)
+    assert signals["buy"].any() and signals["sell"].any()
+
+    np.testing.assert_array_equal(marker_values(signals["buy"], df["Close"]), as_markers(buy))
+    np.testing.assert_array_equal(marker_values(signals["sell"], df["Close"]), as_markers(sell))
+
+    table = events_table(df, signals)
+    expected = sorted(
+        [(df["Date"].iloc[i], "buy", v) for i, v in enumerate(buy) if v is not None]
+        + [(df["Date"].iloc[i], "sell", v) for i, v in enumerate(sell) if v is not None]
+    )
+    assert list(table.itertuples(index=False, name=None)) == expected
+
+
+def test_ties_and_nan_never_cross():
+    a = pd.Series([1.0, 1.0, 2.0, 2.0, np.nan, 3.0, 1.0])
+    b = pd.Series([np.nan, 1.0, 1.0, 2.0, 2.0, 2.0, 1.0])
+    np.testing.assert_array_equal(cross_above(a, b), [False, False, True, False, False, False, False])
+    np.testing.assert_array_equal(cross_below(a, b), [False, False, False, False, False, False, False])
+
+
+def test_bollinger_touches_match_the_loop():
+    df = random_frame(np.float64)
+    touches = bollinger_touches(df)
+    p, ub, lb = df["Close"], df["UB"], df["LB"]
+    upper = [i > 0 and p[i] >= ub[i] and p[i - 1] < ub[i - 1] for i in range(len(df))]
+    lower = [i > 0 and p[i] <= lb[i] and p[i - 1] > lb[i - 1] for i in range(len(df))]
+    np.testing.assert_array_equal(touches["upper"], upper)
+    np.testing.assert_array_equal(touches["lower"], lower)
@@ -0,0 +1,82 @@
+import hashlib
+import secrets
+
+import pytest
+
+import user_store
+from user_store import UserStore, check_password, hash_password
+
+
+@pytest.fixture(autouse=True)
+def cheap_hashes(monkeypatch):
+    monkeypatch.setattr(user_store, "PASSWORD_ITERATIONS", 1000)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = UserStore(str(tmp_path / "users.db"), legacy_csv=None)
+    yield store
+    store.close()
+
+
+def stored_hash(store, email):
+    with store._lock:
+        return store._conn.execute("SELECT password_hash FROM users WHERE email = ?", (email,)).fetchone()[0]
+
+
+def test_verify_and_wrong_password(store):
+    assert store.create_user("a@example.com", "s3cret")
+    assert store.verify("a@example.com", "s3cret")
+    assert not store.verify("a@example.com", "S3cret")
+    assert not store.verify("nobody@example.com", "s3cret")
+
+
+def test_duplicate_signup_is_rejected(store):
+    assert store.create_user("a@example.com", "first")
+    assert not store.create_user("a@example.com", "second")
+    assert store.count() == 2  # the seeded admin and one account
+    assert store.verify("a@example.com", "first")
+
+
+def test_cheaper_hash_is_upgraded_at_login(store):
+    store.create_user("a@example.com", "s3cret")
+    with store._lock:
+        store._conn.execute(
+            "UPDATE users SET password_hash = ? WHERE email = ?", (hash_password("s3cret", 10), "a@example.com")
+        )
+    assert not store.verify("a@example.com", "wrong")
+    assert stored_hash(store, "a@example.com").startswith("pbkdf2_sha256$10$")
+    assert store.verify("a@example.com", "s3cret")
+    assert stored_hash(store, "a@example.com").startswith("pbkdf2_sha256$1000$")
+
+
+def test_old_import_hashes_are_wrapped_then_upgraded(tmp_path):
+    salt = secrets.token_hex(16)
+    legacy = f"legacy_sha256${salt}${hashlib.sha256(bytes.fromhex(salt) + b'pw').hexdigest()}"
+    store = UserStore(str(tmp_path / "users.db"), legacy_csv=None)
+    with store._lock:
+        store._conn.execute("INSERT INTO users VALUES (?, ?, 0)", ("old@example.com", legacy))
+    store.close()
+
+    store = UserStore(str(tmp_path / "users.db"), legacy_csv=None)
+    assert stored_hash(store, "old@example.com").startswith("pbkdf2_legacy$1000$")
+    assert not store.verify("old@example.com", "wrong")
+    assert store.verify("old@example.com", "pw")
+    assert stored_hash(store, "old@example.com").startswith("pbkdf2_sha256$1000$")
+    store.close()
+
+
+def test_csv_is_imported_once_with_pbkdf2_and_removed(store, tmp_path):
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text("email,password\na@example.com,one\nb@example.com,two\na@example.com,three\n")
+
+    assert store.migrate_csv(str(csv_path)) == 2
+    assert not csv_path.exists()
+    assert stored_hash(store, "b@example.com").startswith("pbkdf2_sha256$1000$")
+    assert check_password("one", stored_hash(store, "a@example.com")) == (True, False)
+
+    # The same file showing up again is not re-imported, and does not stay on disk
+    csv_path.write_text("email,password\nc@example.com,four\n")
+    assert store.migrate_csv(str(csv_path)) == 0
+    assert not csv_path.exists()
+    assert not store.exists("c@example.com")
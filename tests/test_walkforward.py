@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from providers import SyntheticProvider
+from walkforward import walk_forward
+
+HORIZONS = (1, 5, 30)
+
+
+def refit_loop(close, horizons, window, min_train):
+    """The per-origin sklearn refit walk_forward replaces"""
+    n = len(close)
+    out = []
+    for t in range(min_train - 1, n):
+        lo = 0 if window is None else max(t - window + 1, 0)
+        x = np.arange(lo, t + 1).reshape(-1, 1)
+        model = LinearRegression().fit(x, close[lo:t + 1])
+        for h in horizons:
+            if t + h < n:
+                out.append(model.predict([[t + h]])[0])
+    return np.array(out)
+
+
+@pytest.mark.parametrize("window", [None, 60])
+def test_walk_forward_matches_sklearn_refits(window):
+    df = SyntheticProvider().download("MSFT", "2021-01-01", "2022-01-01")
+    forecasts = walk_forward(df, HORIZONS, window, min_train=30)
+    # One row per (origin, horizon), origins in order
+    forecasts = forecasts.sort_values(["Date", "Horizon"], kind="stable")
+    expected = refit_loop(df["Close"].to_numpy(dtype=float), HORIZONS, window, 30)
+    np.testing.assert_allclose(forecasts["Predicted"].to_numpy(), expected, rtol=1e-9, atol=1e-9)
+
+    close = df["Close"].to_numpy()
+    origin = df["Date"].searchsorted(forecasts["Date"])
+    np.testing.assert_array_equal(forecasts["Actual"], close[origin + forecasts["Horizon"].to_numpy()])
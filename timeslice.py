@@ -0,0 +1,36 @@
+# -------------------------------------------------------------------
+# TIME-INDEXED SLICING
+# -------------------------------------------------------------------
+# Loaded histories are kept sorted by "Date" (providers and the history
+# store both guarantee it), so a date range is two binary searches on the
+# Date column and a positional slice. The result shares the parent
+# frame's buffers instead of materializing a boolean mask and a copy.
+
+import numpy as np
+import pandas as pd
+
+
+def _position(dates, when, side):
+    return int(np.searchsorted(dates, np.datetime64(pd.Timestamp(when)), side=side))
+
+
+def date_bounds(df, start=None, end=None, inclusive_end=True):
+    """(lo, hi) row positions of start <= Date <= end (or < end)"""
+    dates = df["Date"].to_numpy()
+    lo = 0 if start is None else _position(dates, start, "left")
+    if end is None:
+        hi = len(dates)
+    else:
+        hi = _position(dates, end, "right" if inclusive_end else "left")
+    return lo, max(lo, hi)
+
+
+def date_slice(df, start=None, end=None, inclusive_end=True):
+    """View of the rows between start and end, found by binary search"""
+    lo, hi = date_bounds(df, start, end, inclusive_end)
+    return df.iloc[lo:hi]
+
+
+def last_rows(obj, n):
+    """Trailing n rows as a view (same as .tail(n))"""
+    return obj.iloc[max(len(obj) - n, 0):]
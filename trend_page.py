@@ -0,0 +1,1181 @@
+# -------------------------------------------------------------------
+# TREND ANALYSIS PAGE
+# -------------------------------------------------------------------
+# Everything behind the login. main.py imports this module only when the
+# trend page is routed to, so pandas, Plotly, yfinance and scikit-learn
+# are not loaded while the login and signup pages render.
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+from plotly import graph_objs as go
+from plotly.subplots import make_subplots
+import numpy as np
+
+from analysis_context import ContextCache
+from jobs import JobRunner
+from history_store import HistoryStore
+from bar_store import IntradayStore
+from frame_memory import compact_frame, memory_report, with_columns
+from mapped_store import MAPPED_STORE_DIR, MappedStore
+from providers import BARS_PER_DAY, INTERVALS, INTRADAY_LOOKBACK
+from frame_cache import FrameCache
+from figure_cache import FigureCache
+from prefetch import UNIVERSE, UniverseWarmer
+from indicators import IndicatorBook
+from regimes import RegimeBook
+from seasonality import TREND_WINDOW, seasonal_strength
+from live_feed import LiveHub
+from live_chart import REFRESH_SECONDS, chart_patch, live_chart
+from signals import bollinger_touches, cross_above
+from downsample import downsample_frame
+from timeslice import date_bounds, last_rows
+from forecast import MAX_HORIZON
+from walkforward import HORIZONS, forecast_accuracy
+from backtest import BACKTEST_COLUMNS, STRATEGIES, backtest, run_backtests
+from screener import SCREENER_COLUMNS, load_universe, make_pool, run_screener
+
+# -------------------------------------------------------------------
+# DATA LOADING
+# -------------------------------------------------------------------
+START = "2010-01-01"
+INTERVAL_LABELS = {"1d": "Daily", "15m": "15 min", "5m": "5 min", "1m": "1 min"}
+REGIME_COLORS = {
+    "Uptrend": "lime",
+    "Downtrend": "red",
+    "Sideways": "yellow",
+    "High volatility": "red",
+    "Low volatility": "green",
+}
+# Calendar cycles offered in the Seasonal Trends tab, in bars
+CALENDAR_PERIODS = {
+    "1d": {5: "Week", 21: "Month", 63: "Quarter", 252: "Year"},
+    **{iv: {n: "Day", 5 * n: "Week"} for iv, n in BARS_PER_DAY.items() if iv != "1d"},
+}
+
+@st.cache_resource
+def get_history_store():
+    return HistoryStore()
+
+@st.cache_resource
+def get_bar_store():
+    return IntradayStore()
+
+@st.cache_resource
+def get_mapped_store():
+    # Histories published by the mapped_store writer, shared by every server process
+    return MappedStore() if MAPPED_STORE_DIR else None
+
+@st.cache_resource
+def get_frame_cache():
+    # Shared by every session in this server process
+    return FrameCache()
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache()
+
+@st.cache_resource
+def get_context_cache():
+    # Analysis results per (ticker, data fingerprint), shared by all sessions
+    return ContextCache()
+
+@st.cache_resource
+def get_job_runner():
+    # Background AI analysis jobs, polled by the sessions that submitted them
+    return JobRunner()
+
+@st.cache_resource
+def get_screener_pool():
+    # Spawned once per server process and reused by every screener run
+    return make_pool()
+
+@st.cache_resource
+def get_indicator_book():
+    return IndicatorBook()
+
+@st.cache_resource
+def get_regime_book():
+    # Change-point searches per ticker, resumed as new bars arrive
+    return RegimeBook()
+
+def replay_bars(ticker):
+    """Recent 1-minute bars the live mode replays in place of a market feed"""
+    start, end = intraday_window("1m")
+    return get_bar_store().sync(ticker, "1m", start, end)
+
+@st.cache_resource
+def get_live_hub():
+    # One replay feed per watched ticker, shared by every session in the process
+    return LiveHub(replay_bars)
+
+@st.cache_resource
+def start_universe_warmer():
+    # One warmer per server process keeps the selectbox universe cached
+    if get_mapped_store() is not None:
+        return None  # the mapped_store writer process keeps it fresh instead
+    warmer = UniverseWarmer(get_history_store(), get_frame_cache(), UNIVERSE, START)
+    warmer.start()
+    return warmer
+
+def history_end():
+    """End date of the daily history, taken per rerun so a long-running server keeps advancing"""
+    return date.today().strftime("%Y-%m-%d")
+
+def day_range_bounds(df, start_date, end_date):
+    """(lo, hi) rows from start_date through the whole of end_date, so intraday keeps the last session"""
+    return date_bounds(df, start_date, end_date + timedelta(days=1), inclusive_end=False)
+
+def day_range(df, start_date, end_date):
+    """View of the rows from start_date through the whole of end_date"""
+    lo, hi = day_range_bounds(df, start_date, end_date)
+    return df.iloc[lo:hi]
+
+def intraday_window(interval):
+    """[start, end) dates of the intraday bars the page loads"""
+    today = date.today()
+    start = today - timedelta(days=INTRADAY_LOOKBACK[interval])
+    return start.strftime("%Y-%m-%d"), (today + timedelta(days=1)).strftime("%Y-%m-%d")
+
+def load_data(ticker, interval="1d"):
+    # Served from the in-memory cache, then the Parquet history on disk;
+    # only bars newer than the last stored date are downloaded
+    if interval != "1d":
+        # Compact day-partitioned bars (float32 prices, integer volume)
+        start, end = intraday_window(interval)
+        return get_frame_cache().get_or_load(
+            (ticker, start, end, interval), lambda: get_bar_store().sync(ticker, interval, start, end)
+        )
+    mapped = get_mapped_store()
+    if mapped is not None:
+        # Zero-copy view on the memory-mapped file; unpublished tickers load as usual
+        df = mapped.read(ticker)
+        if df is not None:
+            return df
+    end = history_end()
+    key = (ticker, START, end, interval)
+    return get_frame_cache().get_or_load(
+        key, lambda: compact_frame(get_history_store().sync(ticker, START, end))
+    )
+
+# def load_data(ticker):
+#     yf.set_tz_cache_location("/tmp")
+#     stock = yf.Ticker(ticker)
+#     df = stock.history(period="max", interval="1d")
+#     df.reset_index(inplace=True)
+#     return df
+
+# -------------------------------------------------------------------
+# CHART BUILDERS
+# -------------------------------------------------------------------
+def build_price_figure(filtered_df, stock):
+    """Candlestick chart for the Market Overview tab"""
+    fig_price = go.Figure()
+
+    # Add candlestick chart
+    fig_price.add_trace(go.Candlestick(
+        x=filtered_df.Date,
+        open=filtered_df.Open,
+        high=filtered_df.High,
+        low=filtered_df.Low,
+        close=filtered_df.Close,
+        name="OHLC"
+    ))
+
+    fig_price.update_layout(
+        title=f"{stock} Price Action (Candlestick Chart)",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        template="plotly_dark",
+        height=500
+    )
+    return fig_price
+
+def build_volume_figure(filtered_df):
+    fig_volume = go.Figure()
+    fig_volume.add_trace(go.Bar(
+        x=filtered_df.Date,
+        y=filtered_df.Volume,
+        name="Volume",
+        marker_color='skyblue'
+    ))
+    fig_volume.update_layout(
+        title="Trading Volume",
+        template="plotly_dark",
+        height=300
+    )
+    return fig_volume
+
+def daily_bars(df, interval):
+    """One row per trading session; intraday bars are rolled up (high, low, last close, total volume)"""
+    if interval == "1d":
+        return df
+    return df.groupby(df['Date'].dt.normalize(), sort=False).agg(
+        High=('High', 'max'), Low=('Low', 'min'), Close=('Close', 'last'), Volume=('Volume', 'sum')
+    )
+
+def span_label(interval, bars):
+    """Label for a window counted in bars: '30d' on daily bars, '30 bars' intraday"""
+    return f"{bars}d" if interval == "1d" else f"{bars} bars"
+
+def volume_metrics(filtered_df):
+    """Average/peak/lowest volume and the 30-day volume trend"""
+    avg_volume = filtered_df['Volume'].mean()
+    max_volume = filtered_df['Volume'].max()
+    min_volume = filtered_df['Volume'].min()
+
+    # Volume trend
+    recent_vol = last_rows(filtered_df['Volume'], 30).mean()
+    older_vol = filtered_df['Volume'].iloc[:len(filtered_df)-30].mean() if len(filtered_df) > 30 else avg_volume
+    vol_change = ((recent_vol - older_vol) / older_vol) * 100 if older_vol > 0 else 0
+
+    return {
+        'avg_volume': avg_volume,
+        'max_volume': max_volume,
+        'min_volume': min_volume,
+        'vol_change': vol_change
+    }
+
+def build_ma_figure(filtered_df):
+    """Close, SMA20 and EMA20 with crossover buy markers"""
+    plot_df = downsample_frame(filtered_df)
+    fig_ma = go.Figure()
+
+    # Close Price
+    fig_ma.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.Close,
+        name="Close Price",
+        line=dict(color="white")
+    ))
+
+    # SMA
+    fig_ma.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.SMA20,
+        name="SMA 20",
+        line=dict(color="orange")
+    ))
+
+    # EMA
+    fig_ma.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.EMA20,
+        name="EMA 20",
+        line=dict(color="cyan")
+    ))
+
+    # -----------------------------
+    # BUY SIGNALS (vectorized crossovers)
+    # -----------------------------
+    # Detected at full resolution; only the event bars are plotted
+    sma_buy = cross_above(filtered_df['Close'], filtered_df['SMA20'])
+    ema_buy = cross_above(filtered_df['Close'], filtered_df['EMA20'])
+
+    # -----------------------------
+    # PLOT BUY SIGNALS
+    # -----------------------------
+    fig_ma.add_trace(go.Scatter(
+        x=filtered_df.Date[sma_buy],
+        y=filtered_df.Close[sma_buy],
+        mode='markers',
+        name='SMA Buy',
+        marker=dict(color='green', size=9, symbol="triangle-up")
+    ))
+
+    fig_ma.add_trace(go.Scatter(
+        x=filtered_df.Date[ema_buy],
+        y=filtered_df.Close[ema_buy],
+        mode='markers',
+        name='EMA Buy',
+        marker=dict(color='blue', size=9, symbol="triangle-up")
+    ))
+
+    # Layout (ONLY THIS CHART)
+    fig_ma.update_layout(
+        title="Moving Average Crossover Strategy",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        template="plotly_dark",
+        height=600
+    )
+    return fig_ma
+
+def build_trend_figure(filtered_df, first_bar=0, trend_regimes=None, vol_regimes=None):
+    """Global trend line plus regime segments; the direction text rides along in layout.meta
+
+    first_bar is filtered_df's row number in the full history, which the
+    regime fits are expressed in.
+    """
+    # create index
+    x = np.arange(len(filtered_df))
+    y = filtered_df["Close"].values
+
+    # linear regression trend
+    coef = np.polyfit(x, y, 1)
+    trend = coef[0] * x + coef[1]
+
+    # trend direction
+    slope = coef[0]
+
+    if slope > 0:
+        trend_text = "UPTREND 📈 (BUY)"
+        color = "green"
+    elif slope < 0:
+        trend_text = "DOWNTREND 📉 (SELL)"
+        color = "red"
+    else:
+        trend_text = "SIDEWAYS ➖ (HOLD)"
+        color = "yellow"
+
+    # plot
+    plot_df = downsample_frame(filtered_df)
+    fig = go.Figure()
+
+    # close price
+    fig.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.Close,
+        name="Close Price",
+        line=dict(color="white")
+    ))
+
+    # trend line (straight, so its endpoints are enough)
+    fig.add_trace(go.Scatter(
+        x=filtered_df.Date.iloc[[0, -1]],
+        y=trend[[0, -1]],
+        name="Trend Line",
+        line=dict(color=color, width=3)
+    ))
+
+    # Regimes overlapping the range: fitted segment trends and shaded volatility
+    first, last = filtered_df.Date.iloc[0], filtered_df.Date.iloc[-1]
+    if trend_regimes is not None:
+        shown = set()
+        for seg in regimes_in_range(trend_regimes, first, last).itertuples():
+            lo, hi = date_bounds(filtered_df, max(seg.Start, first), min(seg.End, last))
+            # A fitted exponential trend: a couple of dozen points draw it smoothly
+            rows = np.unique(np.linspace(lo, hi - 1, 24).astype(int))
+            fig.add_trace(go.Scatter(
+                x=filtered_df.Date.iloc[rows],
+                y=np.exp(seg.Intercept + seg.Slope * (first_bar + rows)),
+                name=f"{seg.Regime} regime",
+                legendgroup=seg.Regime,
+                showlegend=seg.Regime not in shown,
+                line=dict(color=REGIME_COLORS[seg.Regime], width=2, dash="dot")
+            ))
+            shown.add(seg.Regime)
+    if vol_regimes is not None:
+        for seg in regimes_in_range(vol_regimes, first, last).itertuples():
+            if seg.Regime in REGIME_COLORS:
+                fig.add_vrect(
+                    x0=max(seg.Start, first), x1=min(seg.End, last),
+                    fillcolor=REGIME_COLORS[seg.Regime], opacity=0.12, layer="below", line_width=0
+                )
+
+    fig.update_layout(
+        title="Stock Trend Line",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        template="plotly_dark",
+        height=600,
+        meta=trend_text
+    )
+    return fig
+
+def regimes_in_range(regimes, first, last):
+    """Regime rows that overlap [first, last]"""
+    return regimes[(regimes.End >= first) & (regimes.Start <= last)]
+
+def build_bollinger_figure(filtered_df):
+    plot_df = downsample_frame(filtered_df)
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.Close,
+        name="Close"
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.UB,
+        name="Upper Band"
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.LB,
+        name="Lower Band"
+    ))
+
+    # Band touches
+    touches = bollinger_touches(filtered_df)
+    fig.add_trace(go.Scatter(
+        x=filtered_df.Date[touches["lower"]],
+        y=filtered_df.Close[touches["lower"]],
+        mode='markers',
+        name='Lower Band Touch',
+        marker=dict(color='green', size=9, symbol="triangle-up")
+    ))
+    fig.add_trace(go.Scatter(
+        x=filtered_df.Date[touches["upper"]],
+        y=filtered_df.Close[touches["upper"]],
+        mode='markers',
+        name='Upper Band Touch',
+        marker=dict(color='red', size=9, symbol="triangle-down")
+    ))
+
+    fig.update_layout(
+        title="Bollinger Bands",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        template="plotly_dark",
+        height=600
+    )
+    return fig
+
+def build_prediction_figure(stock, df, pred_df, predictions):
+    """History plus the forecast and its 5% band"""
+    hist_df = downsample_frame(df)
+    fig_pred = go.Figure()
+    fig_pred.add_trace(go.Scatter(
+        x=hist_df.Date, y=hist_df.Close, name="Historical Prices", 
+        line=dict(color='white', width=3),
+        fill='tozeroy', fillcolor='rgba(255,255,255,0.1)'
+    ))
+    fig_pred.add_trace(go.Scatter(
+        x=pred_df.Date, y=pred_df.Predicted_Close, name="AI Predictions", 
+        line=dict(color='#FF6B6B', width=3, dash='dash')
+    ))
+
+    # Add confidence interval
+    upper_bound = predictions * 1.05  # 5% upper bound
+    lower_bound = predictions * 0.95  # 5% lower bound
+
+    fig_pred.add_trace(go.Scatter(
+        x=list(pred_df.Date) + list(pred_df.Date[::-1]),
+        y=list(upper_bound) + list(lower_bound[::-1]),
+        fill='toself',
+        fillcolor='rgba(255, 107, 107, 0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name='Confidence Interval (5%)'
+    ))
+
+    fig_pred.update_layout(
+        title=f"{stock} - AI Price Prediction & Confidence Interval",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        template="plotly_dark",
+        height=500,
+        hovermode='x unified'
+    )
+    return fig_pred
+
+def run_ai_analysis(ctx, stock, days_ahead, report):
+    """Background job behind "Run AI Analysis": forecast, signals and chart"""
+    report(0.1, "Fitting the price forecast...")
+    # One fit per data version; the slider only slices the fan
+    future_dates, predictions = ctx.predictions(days_ahead)
+    pred_df = pd.DataFrame({
+        'Date': future_dates,
+        'Predicted_Close': predictions
+    })
+
+    report(0.4, "Scoring trend, momentum and RSI...")
+    recommendation = ctx.recommendation(days_ahead)
+
+    report(0.7, "Building the prediction chart...")
+    figure = build_prediction_figure(stock, ctx.df, pred_df, predictions)
+    return {
+        "recommendation": recommendation,
+        "predictions": predictions,
+        "pred_df": pred_df,
+        "trend": ctx.trend,
+        "figure": figure,
+    }
+
+@st.fragment(run_every=0.5)
+def ai_job_progress(job):
+    """Poll a running analysis job; rerun the page once it has finished"""
+    if job.done:
+        st.rerun()
+    st.progress(job.progress, text=f"🤖 {job.message}")
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def live_panel(ticker):
+    """Live price and indicators; the chart is sent only the bars it has not seen"""
+    feed = get_live_hub().feed(ticker)
+    if feed is None:
+        st.warning(f"📡 No intraday bars available to stream for {ticker}")
+        return
+
+    sent = st.session_state.get("live_cursor")
+    patch = None
+    if sent is not None and sent[0] == (ticker, feed.epoch) and not st.session_state.get("live_resync"):
+        got = feed.since(sent[1])
+        if got is not None:
+            patch = chart_patch(feed.epoch, sent[1], got[0], got[1])
+    if patch is None:
+        seq, bars = feed.snapshot()
+        patch = chart_patch(feed.epoch, seq - len(bars), seq, bars, reset=True)
+    st.session_state["live_cursor"] = ((ticker, feed.epoch), patch["seq"])
+
+    _, recent = feed.snapshot(2)
+    last = recent[-1]
+    prev = recent[0]["close"] if len(recent) > 1 else last["close"]
+    c1, c2, c3 = st.columns(3)
+    c1.metric("📡 Live Price", f"${last['close']:.2f}", f"{(last['close'] - prev) / prev * 100:+.2f}%")
+    if last["sma"] is not None:
+        c2.metric("SMA20 / Bollinger", f"${last['sma']:.2f}", f"${last['lb']:.2f} – ${last['ub']:.2f}", delta_color="off")
+    if last["rsi"] is not None:
+        c3.metric("RSI", f"{last['rsi']:.1f}")
+    st.session_state["live_resync"] = live_chart(patch, key="live_chart")
+
+def build_score_figure(ctx, start_date, end_date, days_ahead):
+    """AI score as of every date in the selected range"""
+    # Scored on the full history so the first dates in range have context
+    timeline = day_range(ctx.score_history(days_ahead), start_date, end_date)
+    plot_df = downsample_frame(timeline, "Score", method="minmax")
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=plot_df.Date,
+        y=plot_df.Score,
+        name="AI Score",
+        line=dict(color="#4ECDC4", shape="hv"),
+        customdata=plot_df.Recommendation,
+        hovertemplate="%{x|%Y-%m-%d}<br>Score %{y:+d}<br>%{customdata}<extra></extra>"
+    ))
+    for level, color in ((4, "green"), (2, "lightgreen"), (-2, "pink"), (-4, "red")):
+        fig.add_hline(y=level, line=dict(color=color, dash="dot", width=1))
+
+    fig.update_layout(
+        title="AI Score Timeline",
+        xaxis_title="Date",
+        yaxis_title="Score",
+        template="plotly_dark",
+        height=400
+    )
+    return fig
+
+def forecast_accuracy_in_range(ctx, start_date, end_date, days_ahead, window=None):
+    """Walk-forward error table for forecasts made inside the selected range"""
+    horizons = sorted(set(HORIZONS) | {days_ahead})
+    forecasts = day_range(ctx.walk_forward(horizons, window), start_date, end_date)
+    return forecast_accuracy(forecasts)
+
+def build_seasonal_figure(parts):
+    """Close with its trend, then one panel per seasonal component and the residual"""
+    seasonal_cols = [c for c in parts.columns if c.startswith("Seasonal ")]
+    titles = ["Trend Component"] + [f"{c} Component" for c in seasonal_cols] + ["Residual Component"]
+    fig = make_subplots(rows=len(titles), cols=1, shared_xaxes=True, subplot_titles=titles, vertical_spacing=0.06)
+    plot_df = downsample_frame(parts)
+
+    fig.add_trace(go.Scatter(x=plot_df.Date, y=plot_df.Close, name="Close", line=dict(color="gray", width=1)), row=1, col=1)
+    fig.add_trace(go.Scatter(x=plot_df.Date, y=plot_df.Trend, name="Trend", line=dict(color="orange")), row=1, col=1)
+    for i, col in enumerate(seasonal_cols):
+        fig.add_trace(go.Scatter(x=plot_df.Date, y=plot_df[col], name=col, line=dict(color="cyan")), row=i + 2, col=1)
+    fig.add_trace(go.Scatter(x=plot_df.Date, y=plot_df.Residual, name="Residual", line=dict(color="violet", width=1)),
+                  row=len(titles), col=1)
+
+    fig.update_layout(template="plotly_dark", height=250 * len(titles), showlegend=False)
+    return fig
+
+def tab_memo(name, view_key, build):
+    """Run a tab's data prep/figure build once per (ticker, date range) per session"""
+    memo = st.session_state.setdefault("tab_memo", {})
+    if memo.get("_view") != view_key:
+        memo.clear()
+        memo["_view"] = view_key
+    if name not in memo:
+        memo[name] = build()
+    return memo[name]
+
+def cached_figure(name, view_key, build):
+    """Session memo in front of the process-wide figure cache"""
+    return tab_memo(name, view_key, lambda: get_figure_cache().get_or_build(view_key + (name,), build))
+
+# -------------------------------------------------------------------
+# MAIN APP
+# -------------------------------------------------------------------
+def trend_app():
+    # Header Section
+    st.markdown('<h1 class="title">🚀 Stock Trend Analysis Pro</h1>', unsafe_allow_html=True)
+    st.markdown('<p style="text-align: center; font-size: 1.2em; color: rgba(255,255,255,0.8); margin-bottom: 30px;">Advanced AI-Powered Stock Analysis & Trading Signals</p>', unsafe_allow_html=True)
+    
+    start_universe_warmer()
+
+    # Stock Selection Section
+    st.markdown('<div class="metric-card>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        st.markdown("### 📈 Select Stock")
+        st.markdown("""
+<style>
+div[data-baseweb="select"] > div {
+    background-color: #262730;
+    border-radius: 10px;
+    # padding: 5px;
+                    color: white;
+}
+</style>
+""", unsafe_allow_html=True)
+        stock = st.selectbox(" Stock Symbol", UNIVERSE, label_visibility="collapsed")
+        interval = st.radio(
+            "Interval", INTERVALS, format_func=INTERVAL_LABELS.get, horizontal=True, key="interval"
+        )
+        live_mode = st.toggle("📡 Live (replayed 1-minute feed)", key="live_mode")
+    # Per-series caches (indicators, regimes, analysis, figures) are keyed by ticker and interval
+    series = stock if interval == "1d" else f"{stock} {interval}"
+    
+    # Load data immediately after stock selection
+    df = load_data(stock, interval)
+    if df.empty:
+        # Download failed (and nothing is stored yet); the next rerun retries
+        st.error("❌ No data available")
+        return
+    
+    with col2:
+        st.markdown("### 📊 Current Price")
+        try:
+            current_price = df['Close'].iloc[-1]
+            st.metric("", f"${current_price:.2f}", 
+                     f"{((current_price - df['Close'].iloc[-2]) / df['Close'].iloc[-2] * 100):+.2f}%")
+        except:
+            st.metric("", "Loading...")
+    
+    with col3:
+        st.markdown("### 📅 Data Range")
+        if interval == "1d":
+            st.metric("", f"{len(df)} Days", f"Since {df['Date'].min().strftime('%Y')}")
+        else:
+            st.metric("", f"{len(df):,} Bars", f"Since {df['Date'].min().strftime('%b %d')}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Quick Stats Row
+    st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Windows count trading sessions, so intraday intervals cover the same time as daily
+    days = daily_bars(df, interval)
+    year = last_rows(days, 252)
+    year_label = "52W" if len(year) == 252 else f"{len(year)}D"
+
+    with col1:
+        st.markdown(f"### 📈 {year_label} High")
+        high_52w = year['High'].max()
+        st.metric("", f"${high_52w:.2f}")
+    
+    with col2:
+        st.markdown(f"### 📉 {year_label} Low")
+        low_52w = year['Low'].min()
+        st.metric("", f"${low_52w:.2f}")
+    
+    with col3:
+        st.markdown("### 📊 Avg Volume")
+        avg_vol = last_rows(days['Volume'], 30).mean()
+        st.metric("", f"{avg_vol:,.0f}")
+    
+    with col4:
+        st.markdown("### 📈 Volatility")
+        returns = last_rows(days['Close'], 31).pct_change().std() * 100
+        st.metric("", f"{returns:.2f}%")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if live_mode:
+        live_panel(stock)
+    else:
+        st.session_state.pop("live_cursor", None)  # the chart restarts from a full snapshot
+
+    # Indicators (seeded once per ticker, then extended bar by bar)
+    # joined onto the cached bars without copying either (the Bollinger middle band is SMA20)
+    indicators = get_indicator_book().columns(series, df)
+    df = with_columns(df, indicators)
+
+    col1, col2 = st.columns(2)
+        
+    with col1:
+            # st.markdown("#### 📅 Time Period Selection")
+            start_date = st.date_input(
+                "Start Date",
+                value=df["Date"].min().date(),
+                min_value=df["Date"].min().date(),
+                max_value=df["Date"].max().date(),
+                key=f"overview_start_{interval}"
+            )
+        
+    with col2:
+            end_date = st.date_input(
+                "End Date", 
+                value=df["Date"].max().date(),
+                min_value=df["Date"].min().date(),
+                max_value=df["Date"].max().date(),
+                key=f"overview_end_{interval}"
+            )
+        
+    # Binary search on the sorted Date column; a view, not a masked copy
+    filtered_df = day_range(df, start_date, end_date)
+    
+    # Enhanced Tabs with better styling. Tabs rerun on selection so only
+    # the open tab's data prep and figures are built (and sent).
+    tab1, tab2, tab3, tab4, tab5, tab6, tab_screener, tab7 = st.tabs([
+        "📊 Market Overview",
+        "📈 Technical Analysis", 
+        "📉 Trend Patterns",
+        "🎯 Bollinger Signals",
+        "🧩 Seasonal Trends",
+        "🚀 AI Predictions",
+        "🔎 Screener",
+        "ℹ️ About & Help"
+    ], key="analysis_tabs", on_change="rerun")
+    # The last bar timestamp versions the data behind every cached figure
+    view_key = (series, start_date, end_date, df["Date"].iloc[-1])
+     
+    # ===============================================================
+    # 📊 MARKET OVERVIEW (Enhanced)
+    # ===============================================================
+    with tab1:
+        if tab1.open:
+            st.markdown("### 📊 Comprehensive Market Analysis")
+
+            # Enhanced Price Chart
+            st.markdown("#### 💹 Price Movement Analysis")
+            fig_price = cached_figure("price", view_key, lambda: build_price_figure(filtered_df, stock))
+            st.plotly_chart(fig_price, use_container_width=True)
+
+            # Volume Analysis
+            st.markdown("#### 📊 Volume Analysis")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig_volume = cached_figure("volume", view_key, lambda: build_volume_figure(filtered_df))
+                st.plotly_chart(fig_volume, use_container_width=True)
+
+            with col2:
+                # Volume metrics
+                st.markdown("### 📈 Volume Metrics")
+                vol = tab_memo("volume_metrics", view_key, lambda: volume_metrics(filtered_df))
+
+                st.metric("Average Volume", f"{vol['avg_volume']:,.0f}")
+                st.metric("Peak Volume", f"{vol['max_volume']:,.0f}")
+                st.metric("Lowest Volume", f"{vol['min_volume']:,.0f}")
+
+                vol_change = vol['vol_change']
+                st.metric(f"Volume Trend ({span_label(interval, 30)})", f"{vol_change:+.1f}%", 
+                         delta=f"{vol_change:+.1f}%" if abs(vol_change) > 5 else "Stable")
+    # ===============================================================
+    # 📈 TECHNICAL ANALYSIS
+    # ===============================================================
+    with tab2:
+        if tab2.open:
+            st.markdown("### 📈 Advanced Technical Indicators")
+
+            # Moving Averages Section
+            st.subheader("Moving Average & Crossover Signals")
+            fig_ma = cached_figure("ma", view_key, lambda: build_ma_figure(filtered_df))
+            st.plotly_chart(fig_ma, use_container_width=True)
+        
+    with tab3:
+        if tab3.open:
+            st.subheader("Trend Line Analysis")
+            bars_per_year = 252 * BARS_PER_DAY[interval]
+            trend_regimes = get_regime_book().regimes(series, df, "trend", bars_per_year)
+            vol_regimes = get_regime_book().regimes(series, df, "volatility", bars_per_year)
+            first_bar = day_range_bounds(df, start_date, end_date)[0]
+            fig = cached_figure(
+                "trend", view_key,
+                lambda: build_trend_figure(filtered_df, first_bar, trend_regimes, vol_regimes)
+            )
+            trend_text = fig.layout.meta
+            st.markdown(f"### Trend Direction: {trend_text}")
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Change points found by PELT over the full history
+            st.markdown("#### 🧭 Market Regimes")
+            st.caption("Dotted lines: trend regimes. Shading: high (red) / low (green) volatility regimes.")
+            regime_cols = ["Start", "End", "Bars", "Regime", "Annual Trend %", "Annual Volatility %"]
+            regime_rounding = {"Annual Trend %": 1, "Annual Volatility %": 1}  # leave the dates alone
+            r_col1, r_col2 = st.columns(2)
+            with r_col1:
+                st.markdown("**Trend regimes**")
+                st.dataframe(
+                    regimes_in_range(trend_regimes, filtered_df.Date.iloc[0], filtered_df.Date.iloc[-1])[regime_cols].round(regime_rounding),
+                    use_container_width=True, hide_index=True
+                )
+            with r_col2:
+                st.markdown("**Volatility regimes**")
+                st.dataframe(
+                    regimes_in_range(vol_regimes, filtered_df.Date.iloc[0], filtered_df.Date.iloc[-1])[regime_cols].round(regime_rounding),
+                    use_container_width=True, hide_index=True
+                )
+
+    # ===============================================================
+    # 📊 BOLLINGER BANDS
+    # ===============================================================
+    with tab4:
+        if tab4.open:
+            fig = cached_figure("bollinger", view_key, lambda: build_bollinger_figure(filtered_df))
+            st.plotly_chart(fig, use_container_width=True)
+
+    # ===============================================================
+    # 🧩 TIME SERIES DECOMPOSITION
+    # ===============================================================
+    with tab5:
+        if tab5.open:
+            ctx = tab_memo("analysis_context", view_key, lambda: get_context_cache().get(series, df))
+            lo, hi = day_range_bounds(df, start_date, end_date)
+            detected = ctx.seasonal_periods(lo, hi)
+            calendar = CALENDAR_PERIODS[interval]
+
+            source = st.radio("Seasonal periods", ["Detected", "Calendar"], horizontal=True, key="seasonal_source")
+            if source == "Detected":
+                periods = [p for p, _ in detected]
+                if detected:
+                    st.caption("Periodogram peaks: " + ", ".join(f"{p} bars ({s:.0f}x median power)" for p, s in detected))
+                else:
+                    st.info(f"No significant cycle found in this range; showing a {TREND_WINDOW}-bar trend and the residual.")
+            else:
+                periods = st.multiselect(
+                    "Calendar cycles", list(calendar), default=list(calendar)[:2],
+                    format_func=lambda p: f"{calendar[p]} ({p} bars)", key=f"seasonal_calendar_{interval}"
+                )
+
+            # Decomposition memoized per (ticker, range, periods); figure shared across sessions
+            parts = ctx.decomposition(lo, hi, periods)
+            strength = seasonal_strength(parts)
+            if not strength and source == "Calendar":
+                st.info(f"No selected cycle fits this range; showing a {TREND_WINDOW}-bar trend and the residual.")
+            if strength:
+                for column, (name, value) in zip(st.columns(len(strength)), strength.items()):
+                    column.metric(f"{name} strength", f"{value:.2f}")
+            fig_seasonal = cached_figure(("seasonal", tuple(sorted(periods))), view_key, lambda: build_seasonal_figure(parts))
+            st.plotly_chart(fig_seasonal, use_container_width=True)
+
+    # ===============================================================
+    # 🚀 AI PREDICTIONS & SIGNALS 
+    # ===============================================================
+    with tab6:
+        if tab6.open:
+
+            # RSI, trend, fan and scores are computed once per data version
+            ctx = tab_memo("analysis_context", view_key, lambda: get_context_cache().get(series, df))
+
+            left, center, right = st.columns([0.1,3,0.1])
+
+            with center:
+                st.markdown("### 🚀 AI-Powered Trading Signals")
+                st.markdown("**Advanced Algorithm**: Combining ML predictions with technical analysis for optimal trading decisions")
+                
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+
+                st.markdown("#### ⏱️ Prediction Horizon")
+                # The forecast steps one bar at a time, so intraday horizons are in bars
+                days_ahead = st.slider(
+                    "Prediction Days" if interval == "1d" else "Prediction Bars", 7, MAX_HORIZON, 30,
+                    key="prediction_horizon"
+                )
+
+                st.markdown("#### 🎯 Generate Analysis")
+                run_ai = st.button(
+                    "🚀 Run AI Analysis",
+                    type="primary",
+                    use_container_width=True
+                )
+
+                # The analysis runs on the job pool; this run only submits or polls it
+                ai_key = (series, ctx.fingerprint, days_ahead)
+                if run_ai:
+                    st.session_state["ai_job"] = get_job_runner().submit(
+                        ai_key, run_ai_analysis, ctx, stock, days_ahead
+                    )
+                ai_job = st.session_state.get("ai_job")
+                if ai_job is not None and ai_job.key != ai_key:
+                    ai_job = None  # submitted for another stock/horizon/data version
+
+                if ai_job is not None and not ai_job.done:
+                    ai_job_progress(ai_job)
+                elif ai_job is not None and ai_job.status == "failed":
+                    st.error(f"AI analysis failed: {ai_job.error}")
+                elif ai_job is not None:
+                    result = ai_job.result
+                    recommendation = result["recommendation"]
+                    predictions = result["predictions"]
+                    pred_df = result["pred_df"]
+                    trend_data = result["trend"]
+
+                    st.markdown("---")
+
+                    st.markdown(f"""
+                    <div class='recommendation-box' style='background: {recommendation["color"]}; text-align:center;'>
+                        <h1 style='color: #000;'>{recommendation['recommendation']}</h1>
+                        <p style='color: #000;'>Confidence: {recommendation['confidence']:.0f}%</p>
+                        <p style='color: #000;'>Expected Change: {recommendation['price_change_pct']:+.2f}%</p>
+                        <p style='color: #000;'>AI Score: {recommendation['score']:+d}/8</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    # AI Analysis Breakdown
+                    st.markdown("### 🤖 AI Analysis Breakdown")
+                    for reason in recommendation['reasons']:
+                        st.write(reason)
+                    
+                    # Enhanced Prediction Chart
+                    st.markdown("### 📈 AI Price Prediction Chart")
+                    st.plotly_chart(result["figure"], use_container_width=True)
+                    
+                    # Prediction Statistics Dashboard
+                    st.markdown("### 📊 Prediction Analytics")
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Current Price", f"${df['Close'].iloc[-1]:.2f}")
+                    
+                    with col2:
+                        avg_pred = predictions.mean()
+                        st.metric("Avg Prediction", f"${avg_pred:.2f}")
+                    
+                    with col3:
+                        price_change = predictions[-1] - df['Close'].iloc[-1]
+                        pct_change = (price_change / df['Close'].iloc[-1]) * 100
+                        st.metric("Price Change", f"${price_change:.2f}", f"{pct_change:+.2f}%")
+                    
+                    with col4:
+                        volatility = predictions.std() / predictions.mean() * 100
+                        st.metric("Prediction Risk", f"{volatility:.2f}%")
+                    
+                    # Technical Indicators Dashboard
+                    st.markdown("### 📉 Technical Indicators")
+                    t_col1, t_col2, t_col3, t_col4 = st.columns(4)
+                    
+                    with t_col1:
+                        trend_dir = "📈 Bullish" if trend_data['slope'] > 0 else "📉 Bearish"
+                        st.metric("Trend Direction", trend_dir)
+                    
+                    with t_col2:
+                        st.metric(f"Momentum ({span_label(interval, 30)})", f"{trend_data['momentum']:+.2f}%")
+                    
+                    with t_col3:
+                        rsi_status = "Oversold" if trend_data['rsi'] < 30 else "Overbought" if trend_data['rsi'] > 70 else "Neutral"
+                        st.metric("RSI Status", f"{trend_data['rsi']:.2f}")
+                    
+                    with t_col4:
+                        st.metric("RSI Signal", rsi_status)
+                    
+                    # Detailed Predictions Table
+                    st.markdown("### 📋 Detailed AI Predictions")
+                    st.dataframe(
+                        pred_df.style.format({'Predicted_Close': '${:.2f}'}),
+                        use_container_width=True
+                    )
+
+            # Historical score timeline (same rules, every date at once)
+            st.markdown("### 🕒 AI Score History")
+            fig_score = cached_figure(
+                f"score_history_{days_ahead}", view_key,
+                lambda: build_score_figure(ctx, start_date, end_date, days_ahead)
+            )
+            st.plotly_chart(fig_score, use_container_width=True)
+
+            # Walk-forward accuracy of the regression forecast
+            st.markdown("### 📏 Forecast Accuracy (walk-forward)")
+            wf_mode = st.radio(
+                "Training window", ["Expanding", "Rolling 250 bars"], horizontal=True, key="walkforward_window"
+            )
+            wf_window = None if wf_mode == "Expanding" else 250
+            accuracy = tab_memo(
+                f"walkforward_{wf_window}_{days_ahead}", view_key,
+                lambda: forecast_accuracy_in_range(ctx, start_date, end_date, days_ahead, wf_window)
+            )
+            st.caption("Forecasts made at every close in the selected range, scored against the close h bars later.")
+            st.dataframe(accuracy.round(2), use_container_width=True, hide_index=True)
+
+            st.markdown('</div>', unsafe_allow_html=True)
+    # ===============================================================
+    # 🔎 UNIVERSE SCREENER
+    # ===============================================================
+    with tab_screener:
+        if tab_screener.open:
+            st.markdown("### 🔎 AI Screener")
+            st.markdown("Runs the AI recommendation for every symbol in the universe in parallel.")
+
+            universe_text = st.text_area(
+                "Universe (comma or newline separated)",
+                value=", ".join(load_universe()),
+                key="screener_universe"
+            )
+            screen_days = st.slider("Prediction Days", 7, MAX_HORIZON, 30, key="screener_days")
+            run_screen = st.button("🔎 Run Screener", use_container_width=True)
+
+            if run_screen:
+                tickers = [t.strip().upper() for t in universe_text.replace("\n", ",").split(",") if t.strip()]
+                progress = st.progress(0.0, text="Screening...")
+                table = st.empty()
+                rows = []
+                for chunk in run_screener(tickers, START, history_end(), screen_days, pool=get_screener_pool()):
+                    rows.extend(chunk)
+                    progress.progress(len(rows) / len(tickers), text=f"Screened {len(rows)}/{len(tickers)}")
+                    # Sortable table, refreshed as each chunk of results arrives
+                    table.dataframe(
+                        pd.DataFrame(rows, columns=SCREENER_COLUMNS).sort_values("Score", ascending=False),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                progress.empty()
+
+            # Backtest the same signals over the full history
+            st.markdown("### 📊 Signal Backtest")
+            st.markdown("Replays the AI recommendation and the SMA/EMA crossovers as positions, traded at the signal bar's close.")
+            bt_col1, bt_col2, bt_col3 = st.columns(3)
+            with bt_col1:
+                bt_strategies = st.multiselect(
+                    "Strategies", list(STRATEGIES), default=list(STRATEGIES), key="backtest_strategies"
+                )
+            with bt_col2:
+                bt_cost = st.number_input("Cost per trade (bps)", 0.0, 100.0, 5.0, 0.5, key="backtest_cost")
+            with bt_col3:
+                bt_short = st.checkbox("Short on SELL", value=False, key="backtest_short")
+            run_bt = st.button("📊 Run Backtest", use_container_width=True)
+
+            if run_bt and bt_strategies:
+                # Equity curves for the selected stock, annualized by the interval's bars per year
+                fig_bt = go.Figure()
+                for strategy in bt_strategies:
+                    result, _ = backtest(df, strategy, bt_cost, bt_short,
+                                         periods_per_year=252 * BARS_PER_DAY[interval])
+                    plot_df = downsample_frame(result, "Equity")
+                    fig_bt.add_trace(go.Scatter(x=plot_df.Date, y=plot_df.Equity, name=strategy.upper()))
+                plot_df = downsample_frame(result, "Buy & Hold")
+                fig_bt.add_trace(go.Scatter(
+                    x=plot_df.Date, y=plot_df["Buy & Hold"], name="Buy & Hold", line=dict(color="gray", dash="dot")
+                ))
+                fig_bt.update_layout(
+                    title=f"{stock} Strategy Equity (growth of 1)",
+                    xaxis_title="Date",
+                    yaxis_title="Equity",
+                    template="plotly_dark",
+                    height=450
+                )
+                st.plotly_chart(fig_bt, use_container_width=True)
+
+                tickers = [t.strip().upper() for t in universe_text.replace("\n", ",").split(",") if t.strip()]
+                progress = st.progress(0.0, text="Backtesting...")
+                table = st.empty()
+                rows = []
+                for chunk in run_backtests(tickers, START, history_end(), bt_strategies, bt_cost, bt_short,
+                                           pool=get_screener_pool()):
+                    rows.extend(chunk)
+                    progress.progress(len(rows) / (len(tickers) * len(bt_strategies)),
+                                      text=f"Backtested {len(rows) // len(bt_strategies)}/{len(tickers)}")
+                    table.dataframe(
+                        pd.DataFrame(rows, columns=BACKTEST_COLUMNS)
+                        .sort_values("Sharpe", ascending=False).round(2),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                progress.empty()
+    # ===============================================================
+    # ℹ️ ABOUT & HELP
+    # ===============================================================
+    with tab7:
+        if tab7.open:
+            st.markdown("### 📖 About Stock Trend Analysis Pro")
+        
+            st.markdown("""
+            <div style='background: rgba(255,255,255,0.1); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+            <h4>🎯 What We Do</h4>
+            <p><strong>Stock Trend Analysis Pro</strong> is an advanced AI-powered platform designed to help investors and traders make informed decisions through comprehensive technical analysis and machine learning predictions.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+            col1, col2 = st.columns(2)
+        
+            with col1:
+                st.markdown("#### 🚀 Key Features")
+                st.markdown("""
+                - **📊 Real-time Market Data** - Live stock prices and historical data
+                - **🤖 AI Price Predictions** - Machine learning based forecasting
+                - **📈 Technical Indicators** - Moving averages, RSI, Bollinger Bands
+                - **🎯 Smart Buy/Sell Signals** - AI-generated trading recommendations
+                - **📉 Advanced Charts** - Interactive candlestick and trend charts
+                - **📋 Comprehensive Analytics** - Volume analysis and market insights
+                """)
+        
+            with col2:
+                st.markdown("#### 🛠️ Technical Stack")
+                st.markdown("""
+                - **Frontend**: Streamlit (Python)
+                - **Data Source**: Yahoo Finance API
+                - **Visualization**: Plotly.js
+                - **AI/ML**: Scikit-learn (Linear Regression)
+                - **Analysis**: Pandas, NumPy
+                - **Styling**: Custom CSS
+                """)
+        
+            st.markdown("---")
+        
+            st.markdown("#### 👥 Meet the Founders")
+            founder_col1, founder_col2, founder_col3 = st.columns(3)
+        
+            with founder_col1:
+                st.markdown("""
+                <div style='text-align: center; background: rgba(255,255,255,0.1); padding: 15px; border-radius: 10px;'>
+                <h3>Arsh Agrawal</h3>
+                </div>
+                """, unsafe_allow_html=True)
+        
+            with founder_col2:
+                st.markdown("""
+                <div style='text-align: center; background: rgba(255,255,255,0.1); padding: 15px; border-radius: 10px;'>
+                <h3>Prajjwal Tiwari</h3>
+                </div>
+                """, unsafe_allow_html=True)
+        
+            with founder_col3:
+                st.markdown("""
+                <div style='text-align: center; background: rgba(255,255,255,0.1); padding: 15px; border-radius: 10px;'>
+                <h3>Tushar Gaur</h3>
+                </div>
+                """, unsafe_allow_html=True)
+        
+            st.markdown("---")
+        
+            st.markdown("#### ⚠️ Important Disclaimer")
+            st.markdown("""
+            <div style='background: rgba(255,0,0,0.1); border: 1px solid rgba(255,0,0,0.3); padding: 15px; border-radius: 10px;'>
+            <strong>This application is for educational and informational purposes only.</strong>
+        
+            - Not intended as financial advice or investment recommendations
+            - Past performance does not guarantee future results
+            - Always conduct your own research and consult with financial professionals
+            - We are not responsible for any investment decisions made based on this tool
+            </div>
+            """, unsafe_allow_html=True)
+
+            with st.expander("🧠 Session Memory"):
+                # What this session holds beyond the buffers shared by every session
+                report = memory_report(
+                    {"df": df, "filtered_df": filtered_df, **st.session_state.to_dict()},
+                    shared=(get_frame_cache(), get_mapped_store(), get_indicator_book(), get_context_cache(), get_regime_book()),
+                )
+                m1, m2, m3 = st.columns(3)
+                m1.metric("Owned by this session", f"{report['Owned MB'].sum():.2f} MB")
+                m2.metric("Frame cache (shared)", f"{get_frame_cache().nbytes / 1e6:.2f} MB")
+                m3.metric("Figure cache (shared)", f"{get_figure_cache().nbytes / 1e6:.2f} MB")
+                st.dataframe(report.round(3), use_container_width=True, hide_index=True)
+    # Footer
+    # st.markdown('<div class="footer">', unsafe_allow_html=True)
+    st.markdown("""
+                <hr/>\
+                <br/>
+    <div style='text-align: center; color: rgba(255,255,255,0.7);'>
+        <h3 style='margin-bottom: 10px;'>🚀 Stock Trend Analysis Pro</h3>
+        <p><strong>Powered by AI & Advanced Technical Analysis</strong></p>
+        <p>Built with ❤️ by Arsh Agrawal, Prajjwal Tiwari & Tushar Gaur</p>
+        <p style='font-size: 0.9em; margin-top: 15px;'>⚠️ <em>Disclaimer: This tool is for educational purposes only. Not financial advice. Always do your own research.</em></p>
+        <p style='font-size: 0.8em; margin-top: 10px;'>Data provided by Yahoo Finance | Last updated: {current_date}</p>
+    </div>
+    """.format(current_date=date.today().strftime("%B %d, %Y")), unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,272 @@
+# -------------------------------------------------------------------
+# USER STORE
+# -------------------------------------------------------------------
+# Accounts live in an embedded SQLite database in WAL mode: a login is
+# one primary-key lookup on email and a signup is one INSERT, so neither
+# depends on the number of accounts and concurrent signups cannot lose
+# each other's rows. Passwords are stored as salted PBKDF2-SHA256 with
+# the iteration count in the hash string; raising PASSWORD_ITERATIONS
+# upgrades each account's hash at its next successful login.
+#
+# The legacy users.csv is imported once, the first time the database is
+# opened: its passwords are hashed with PBKDF2 on a thread pool (the hash
+# releases the GIL) and the plain-text file is deleted once the import
+# commits. Rows left on the old single-round SHA-256 import hash are
+# wrapped in PBKDF2 when the store opens, and replaced by a plain PBKDF2
+# hash at the user's next login. A very large CSV is best imported up
+# front with the CLI, optionally at a lower --iterations.
+#
+#   python user_store.py migrate users.csv
+#   python user_store.py bench --users 100000
+
+import argparse
+import csv
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+USER_DB = os.environ.get("USER_DB", "users.db")
+LEGACY_CSV = "users.csv"
+PASSWORD_ITERATIONS = int(os.environ.get("PASSWORD_ITERATIONS", "200000"))
+DEFAULT_ADMIN = ("admin@gmail.com", "admin123")  # seeded into an empty store, as before
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    password_hash TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def hash_password(password, iterations=None):
+    """'pbkdf2_sha256$iterations$salt$hash' for a plain-text password"""
+    iterations = iterations or PASSWORD_ITERATIONS
+    salt = secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), iterations)
+    return f"pbkdf2_sha256${iterations}${salt}${digest.hex()}"
+
+
+def wrap_legacy_hash(encoded, iterations=None):
+    """'pbkdf2_legacy$iterations$salt$legacy_salt$hash': PBKDF2 over an old 'legacy_sha256' digest"""
+    _, legacy_salt, legacy_digest = encoded.split("$")
+    iterations = iterations or PASSWORD_ITERATIONS
+    salt = secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", legacy_digest.encode(), bytes.fromhex(salt), iterations)
+    return f"pbkdf2_legacy${iterations}${salt}${legacy_salt}${digest.hex()}"
+
+
+def check_password(password, encoded):
+    """(matches, needs_rehash) for a stored hash string"""
+    parts = encoded.split("$")
+    if parts[0] == "pbkdf2_sha256" and len(parts) == 4:
+        _, iterations, salt, expected = parts
+        secret = password.encode()
+    elif parts[0] == "pbkdf2_legacy" and len(parts) == 5:
+        _, iterations, salt, legacy_salt, expected = parts
+        secret = hashlib.sha256(bytes.fromhex(legacy_salt) + password.encode()).hexdigest().encode()
+    else:
+        return False, False
+    digest = hashlib.pbkdf2_hmac("sha256", secret, bytes.fromhex(salt), int(iterations))
+    matches = hmac.compare_digest(digest.hex(), expected)
+    # Wrapped legacy hashes are replaced by a plain one at the first login
+    return matches, matches and (parts[0] == "pbkdf2_legacy" or int(iterations) != PASSWORD_ITERATIONS)
+
+
+def hash_many(fn, values):
+    """fn over values on a thread pool; hashlib's PBKDF2 runs outside the GIL"""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(fn, values))
+
+
+class UserStore:
+    """Email/password accounts in SQLite, safe to share across sessions"""
+
+    def __init__(self, path=USER_DB, legacy_csv=LEGACY_CSV):
+        self.path = path
+        # One connection per process; the lock serializes statements, the
+        # busy timeout covers other processes writing the same file
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        # Unknown emails still pay for one hash, so timing does not reveal accounts
+        self._dummy_hash = hash_password(secrets.token_hex(8))
+
+        self.upgrade_legacy_hashes()
+        if legacy_csv and os.path.exists(legacy_csv):
+            self.migrate_csv(legacy_csv)
+        if not self.count():
+            self.create_user(*DEFAULT_ADMIN)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def exists(self, email):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone()
+        return row is not None
+
+    def create_user(self, email, password):
+        """Add an account; False when the email is already registered"""
+        encoded = hash_password(password)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO users (email, password_hash, created) VALUES (?, ?, ?)",
+                    (email, encoded, time.time()),
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def verify(self, email, password):
+        """True when the email exists and the password matches"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT password_hash FROM users WHERE email = ?", (email,)
+            ).fetchone()
+        if row is None:
+            check_password(password, self._dummy_hash)
+            return False
+
+        matches, needs_rehash = check_password(password, row[0])
+        if needs_rehash:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE users SET password_hash = ? WHERE email = ?",
+                    (hash_password(password), email),
+                )
+        return matches
+
+    def upgrade_legacy_hashes(self):
+        """Wrap accounts still on the old SHA-256 import hash in PBKDF2; returns how many"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT email, password_hash FROM users WHERE password_hash LIKE 'legacy_sha256$%'"
+            ).fetchall()
+        if not rows:
+            return 0
+        wrapped = hash_many(wrap_legacy_hash, [encoded for _, encoded in rows])
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            # Skips a row another process has already upgraded
+            self._conn.executemany(
+                "UPDATE users SET password_hash = ? WHERE email = ? AND password_hash = ?",
+                [(new, email, old) for (email, old), new in zip(rows, wrapped)],
+            )
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def migrate_csv(self, csv_path, iterations=None):
+        """Import a legacy email,password CSV once and delete it; returns the number of new accounts"""
+        key = f"migrated:{os.path.abspath(csv_path)}"
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                self._remove_csv(csv_path)
+                return 0
+
+        with open(csv_path, newline="") as f:
+            users = [(r["email"], r["password"]) for r in csv.DictReader(f) if r.get("email")]
+        hashes = hash_many(lambda password: hash_password(password, iterations), [p for _, p in users])
+        rows = [(email, encoded, time.time()) for (email, _), encoded in zip(users, hashes)]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have finished the import while we hashed
+                if self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                    self._conn.execute("ROLLBACK")
+                    self._remove_csv(csv_path)
+                    return 0
+                # Earlier rows win when the CSV lists an email twice
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO users (email, password_hash, created) VALUES (?, ?, ?)", rows
+                )
+                self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(time.time())))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            added = self._conn.total_changes - before - 1
+        # The plain-text passwords are in the database now
+        self._remove_csv(csv_path)
+        return added
+
+    @staticmethod
+    def _remove_csv(csv_path):
+        try:
+            os.remove(csv_path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def bench(n_users, logins=200):
+    """Login latency with n_users accounts (cheap hashes for the bulk insert)"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = UserStore(os.path.join(tmp, "bench.db"), legacy_csv=None)
+        cheap = hash_password("x", iterations=1)
+        with store._lock:
+            store._conn.execute("BEGIN")
+            store._conn.executemany(
+                "INSERT OR IGNORE INTO users (email, password_hash, created) VALUES (?, ?, ?)",
+                ((f"user{i}@example.com", cheap, 0.0) for i in range(n_users)),
+            )
+            store._conn.execute("COMMIT")
+
+        emails = [f"user{secrets.randbelow(n_users)}@example.com" for _ in range(logins)]
+        t0 = time.perf_counter()
+        for email in emails:
+            store.exists(email)
+        lookup_us = (time.perf_counter() - t0) / logins * 1e6
+
+        t0 = time.perf_counter()
+        store.verify(DEFAULT_ADMIN[0], DEFAULT_ADMIN[1])
+        verify_ms = (time.perf_counter() - t0) * 1000
+        store.close()
+    print(f"{n_users:>8,} accounts: lookup {lookup_us:.1f} us, "
+          f"full login {verify_ms:.1f} ms ({PASSWORD_ITERATIONS} iterations)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite user store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="import a legacy users.csv")
+    migrate.add_argument("csv", nargs="?", default=LEGACY_CSV)
+    migrate.add_argument("--db", default=USER_DB)
+    migrate.add_argument("--iterations", type=int, default=None,
+                         help="PBKDF2 cost for the imported rows (default PASSWORD_ITERATIONS); "
+                              "cheaper hashes are upgraded at each user's next login")
+    timing = sub.add_parser("bench", help="login latency at a given account count")
+    timing.add_argument("--users", type=int, nargs="+", default=[1000, 100000])
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        store = UserStore(args.db, legacy_csv=None)
+        added = store.migrate_csv(args.csv, args.iterations)
+        print(f"imported {added} accounts into {args.db} ({store.count()} total)")
+    else:
+        for n in args.users:
+            bench(n)
+
+
+if __name__ == "__main__":
+    main()
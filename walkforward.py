@@ -0,0 +1,149 @@
+# -------------------------------------------------------------------
+# WALK-FORWARD FORECAST EVALUATION
+# -------------------------------------------------------------------
+# Replays predict_prices as if it had been run at the close of every
+# past bar and scores each forecast against the close that followed
+# h bars later. The regression of close on bar number only needs the
+# sums of x, y, xy and x² over its training window, so all of the refits
+# come from one pass of cumulative sums: expanding windows start at bar
+# 0 and rolling windows subtract the prefix that fell out.
+#
+#   python walkforward.py AAPL MSFT --window 250 --horizons 1 5 30
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from forecast import MAX_HORIZON
+from history_store import HistoryStore
+from prefix_sums import prefix_sums
+from screener import fan_out, make_pool
+
+HORIZONS = (1, 5, 10, 20, 30, 60, 90)
+MIN_TRAIN = 30  # same minimum history as analyze_trend
+ACCURACY_COLUMNS = ["Ticker", "Horizon", "Forecasts", "MAE", "MAPE %", "Directional %"]
+
+
+def walk_forward(df, horizons=HORIZONS, window=None, min_train=MIN_TRAIN):
+    """Forecast vs. actual close for every origin bar and horizon
+
+    window=None refits on all bars up to the origin (expanding), an int
+    refits on the last `window` bars (rolling). Returns one row per
+    (origin, horizon) whose target bar already exists.
+    """
+    close = df["Close"].to_numpy(dtype=float)
+    n = len(close)
+    horizons = np.asarray(horizons, dtype=np.int64)
+    train = window or n
+    min_train = min(max(min_train, 2), train)
+
+    # Training windows [lo, t] for every origin t
+    origins = np.arange(min_train - 1, n)
+    lo = np.maximum(origins - train + 1, 0)
+    hi = origins + 1
+
+    x = np.arange(n, dtype=float)
+    sy, sxy = prefix_sums(close), prefix_sums(x * close)
+    m = (hi - lo).astype(float)
+    # Closed forms for sums of 0..k-1 and their squares, then differenced
+    sx = (hi * (hi - 1) - lo * (lo - 1)) / 2
+    sxx = ((hi - 1) * hi * (2 * hi - 1) - (lo - 1) * lo * (2 * lo - 1)) / 6
+    win_y = sy[hi] - sy[lo]
+    win_xy = sxy[hi] - sxy[lo]
+
+    beta = (win_xy - sx * win_y / m) / (sxx - sx * sx / m)
+    alpha = (win_y - beta * sx) / m
+
+    # Predicted close at bar origin + h, for each horizon at once
+    target = origins[:, None] + horizons[None, :]
+    predicted = alpha[:, None] + beta[:, None] * target
+    valid = target < n
+    actual = np.where(valid, close[np.minimum(target, n - 1)], np.nan)
+
+    rows, cols = np.nonzero(valid)
+    return pd.DataFrame({
+        "Date": df["Date"].to_numpy()[origins[rows]],
+        "Horizon": horizons[cols],
+        "Close": close[origins[rows]],
+        "Predicted": predicted[rows, cols],
+        "Actual": actual[rows, cols],
+    })
+
+
+def forecast_accuracy(forecasts):
+    """MAE, MAPE and directional hit rate per horizon"""
+    err = forecasts["Predicted"] - forecasts["Actual"]
+    move = forecasts["Actual"] - forecasts["Close"]
+    called = forecasts["Predicted"] - forecasts["Close"]
+    scored = pd.DataFrame({
+        "Horizon": forecasts["Horizon"],
+        "abs_err": err.abs(),
+        "pct_err": (err / forecasts["Actual"]).abs() * 100,
+        "hit": np.sign(move) == np.sign(called),
+    })
+    table = scored.groupby("Horizon").agg(
+        Forecasts=("abs_err", "size"),
+        MAE=("abs_err", "mean"),
+        MAPE=("pct_err", "mean"),
+        Directional=("hit", "mean"),
+    ).reset_index()
+    table["Directional"] *= 100
+    return table.rename(columns={"MAPE": "MAPE %", "Directional": "Directional %"})
+
+
+def evaluate(df, horizons=HORIZONS, window=None, min_train=MIN_TRAIN):
+    """Walk-forward accuracy table for one price history"""
+    return forecast_accuracy(walk_forward(df, horizons, window, min_train))
+
+
+def evaluate_chunk(tickers, start, end, horizons=HORIZONS, window=None):
+    """Worker entry point: load a chunk of tickers and evaluate each"""
+    frames = HistoryStore().sync_many(tickers, start, end)
+    tables = []
+    for ticker in tickers:
+        df = frames.get(ticker)
+        if df is None or len(df) <= MIN_TRAIN:
+            continue
+        table = evaluate(df, horizons, window)
+        table.insert(0, "Ticker", ticker)
+        tables.append(table)
+    return tables
+
+
+def run_evaluation(tickers, start, end, horizons=HORIZONS, window=None, pool=None, chunk_size=None):
+    """Yield per-ticker accuracy tables as each chunk of tickers completes"""
+    for tables in fan_out(evaluate_chunk, tickers, start, end, tuple(horizons), window,
+                          pool=pool, chunk_size=chunk_size):
+        yield from tables
+
+
+def main():
+    from datetime import date
+
+    from screener import load_universe
+
+    parser = argparse.ArgumentParser(description="Walk-forward accuracy of the price forecast")
+    parser.add_argument("tickers", nargs="*", help="defaults to SCREENER_UNIVERSE or the app universe")
+    parser.add_argument("--universe", help="file with one ticker per line")
+    parser.add_argument("--start", default="2010-01-01")
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(HORIZONS))
+    parser.add_argument("--window", type=int, default=None, help="rolling window in bars (default expanding)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if max(args.horizons) > MAX_HORIZON:
+        parser.error(f"horizons are limited to {MAX_HORIZON} bars")
+    tickers = [t.upper() for t in args.tickers] or load_universe(args.universe)
+    end = date.today().strftime("%Y-%m-%d")
+    with make_pool(args.workers) as pool:
+        tables = list(run_evaluation(tickers, args.start, end, args.horizons, args.window, pool=pool))
+    if not tables:
+        print("no ticker had enough history")
+        return
+    table = pd.concat(tables, ignore_index=True)[ACCURACY_COLUMNS].sort_values(["Ticker", "Horizon"])
+    print(table.round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()